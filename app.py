@@ -1,30 +1,76 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory, render_template_string, url_for, make_response, redirect, abort
+from flask import Flask, request, jsonify, render_template, send_from_directory, url_for, make_response, redirect, abort
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-import json
+from markupsafe import Markup, escape
 import os
 import time
 import random
+import re
 import secrets
 import shutil
 import datetime
-import glob
+import functools
+import gzip
+import hashlib
+import heapq
+import http.client
+import io
+import math
+import mmap
+import orjson
+import struct
+import threading
+import logging
+import atexit
+import copy
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 
 # AI + PPT (LM Studio in gpt_utils)
-from utils.gpt_utils import match_kpis_with_ai, generate_newsletter_ai, generate_newsletter_overlay
+from utils.gpt_utils import match_kpis_with_ai, generate_newsletter_ai, generate_newsletter_overlay, get_client
 from utils.ppt_generator import generate_pptx_report
 
 # QR local
 import qrcode
-from markupsafe import escape  # to safely display title in HTML
 
 # ========== APP ==========
+logging.basicConfig(level=logging.INFO)
+log = logging.getLogger("qa")
+
+class OrjsonProvider(DefaultJSONProvider):
+    """jsonify() / request.json through orjson. Keys stay sorted like Flask's default provider."""
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.OPTIONS)  # bytes straight into the response
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 app = Flask(__name__, static_url_path="/static", static_folder="static", template_folder="templates")
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # ======================================
 # Mini "storage" pe disc (un singur JSON)
 # ======================================
 DATA_FILE = "data.json"
+# Append-only log of top-level section updates. Replayed over DATA_FILE on load
+# and folded back into it (compaction) on startup or once it grows too large.
+WAL_FILE = f"{DATA_FILE}.wal"
+WAL_COMPACT_BYTES = 4 * 1024 * 1024
+MMAP_MIN_BYTES = 64 * 1024  # below this a plain read() is cheaper than mmap setup
+# List sections logged per record (by "id") instead of as a whole list: a vote or
+# a quiz edit appends one debate/quiz to the WAL, not every debate/quiz, an
+# awarded point appends one entry instead of rewriting the whole points ledger,
+# and a feedback response appends only the form it belongs to.
+SHARDED_SECTIONS = ("debates", "quizzes", "points_entries", "feedback_forms")
 
 default_structure = {
     "members": [],
@@ -33,28 +79,50 @@ default_structure = {
     "debates": [],  # list – each contains signups/format/flow/rubric/scores/live
     "quizzes": [],  # list – each contains questions/answers/scores
     "quiz_sessions": [],  # live quiz sessions (admin + players + state)
-    "feedback_forms": []  # << NEW
+    "feedback_forms": [],  # << NEW
+    "points_entries": [],
+    "points_criteria": []
 }
 
+_DATA_LOCK = threading.RLock()
+_DATA_CACHE = None     # data.json + replayed WAL, shared by all requests
+_DATA_MTIME = None     # st_mtime_ns of DATA_FILE when _DATA_CACHE was built / last compacted
+_DATA_VERSION = 0      # bumped on every save that changed something
+_SAVE_GEN = 0          # bumped by every save_data() / reload; keys _RESPONSE_CACHE
+_RESPONSE_CACHE = {}   # (endpoint, id) -> ((_SAVE_GEN, stamp) at build time, JSON body, ETag)
+_WAL_FD = os.open(WAL_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+_SECTION_BYTES = {}    # top-level key -> last encoding persisted (snapshot or WAL)
+_ITEM_BYTES = {}       # sharded section -> [(str id, encoding), ...] as last persisted
+_SNAPSHOT_BYTES = {}   # top-level key -> its encoding in DATA_FILE as last read or compacted
+_RETIRED = None        # (dict replaced by an external-edit reload, its section encodings then)
+_COMPACTING = False
+FLUSH_DELAY = 0.2      # seconds the flusher waits to coalesce saves
+_DIRTY = threading.Event()  # set by save_data(), cleared when the flusher writes
+_FSYNC_PENDING = False      # a save in the current batch asked for durable=True
+# Last whole-document states before a change, newest last: (timestamp, json bytes).
+# Kept in memory and only written to data.json.backup.* on shutdown or via /api/admin/backup.
+_BACKUP_RING = deque(maxlen=10)
+BACKUP_MIN_INTERVAL = 60  # seconds between two ring entries
+_LAST_BACKUP_AT = float("-inf")
+_EMPTY_DATA_BYTES = len(orjson.dumps(default_structure)) + 16
+
 def ensure_data_file():
     """Ensure data.json exists and has required structure. NEVER overwrites existing data."""
     if not os.path.exists(DATA_FILE):
         # Only create new file if it doesn't exist
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(default_structure, f, ensure_ascii=False, indent=2)
+        _atomic_write(DATA_FILE, orjson.dumps(default_structure))
         return
     
     # File exists - read it carefully
     try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_snapshot()
         
         if not isinstance(data, dict):
             # File is corrupted but exists - create backup and raise error
             backup_name = f"{DATA_FILE}.corrupted.{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
             try:
                 shutil.copy2(DATA_FILE, backup_name)
-                print(f"ERROR: {DATA_FILE} is corrupted. Created backup: {backup_name}")
+                log.error("%s is corrupted. Created backup: %s", DATA_FILE, backup_name)
             except:
                 pass
             raise ValueError(f"Invalid JSON structure in {DATA_FILE}. Backup created: {backup_name}")
@@ -68,22 +136,14 @@ def ensure_data_file():
         
         # Only save if we added missing keys (not if file was corrupted)
         if changed:
-            # Create backup before modifying
-            backup_name = f"{DATA_FILE}.before_add_keys.{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            try:
-                shutil.copy2(DATA_FILE, backup_name)
-            except:
-                pass
-            
-            with open(DATA_FILE, "w", encoding="utf-8") as wf:
-                json.dump(data, wf, ensure_ascii=False, indent=2)
+            _atomic_write(DATA_FILE, orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
     
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         # JSON parsing error - file is corrupted
         backup_name = f"{DATA_FILE}.corrupted.{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
         try:
             shutil.copy2(DATA_FILE, backup_name)
-            print(f"ERROR: JSON decode error in {DATA_FILE}. Created backup: {backup_name}")
+            log.error("JSON decode error in %s. Created backup: %s", DATA_FILE, backup_name)
         except:
             pass
         # DON'T overwrite - raise error so user knows
@@ -94,60 +154,456 @@ def ensure_data_file():
         backup_name = f"{DATA_FILE}.error.{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
         try:
             shutil.copy2(DATA_FILE, backup_name)
-            print(f"ERROR reading {DATA_FILE}: {e}. Created backup: {backup_name}")
+            log.error("Error reading %s: %s. Created backup: %s", DATA_FILE, e, backup_name)
         except:
             pass
         # NEVER overwrite existing data - raise error instead
         raise ValueError(f"Error reading {DATA_FILE}. Backup created: {backup_name}. Original error: {e}")
 
+def _read_snapshot():
+    """Parse DATA_FILE. Large files are mmapped so orjson reads the page cache directly."""
+    with open(DATA_FILE, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        finally:
+            mm.close()
+
+def _encode_section(value):
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+def _wal_record(op, key, encoded_value=None, item_id=None):
+    """One WAL record: {"op": "put"|"del"|"put_item"|"del_item", "key": <section>, "id": <item>, "value": <json>}"""
+    head = b'{"op":"' + op.encode() + b'","key":' + orjson.dumps(key)
+    if item_id is not None:
+        head += b',"id":' + orjson.dumps(item_id)
+    if encoded_value is not None:
+        return head + b',"value":' + encoded_value + b"}"
+    return head + b"}"
+
+def _encode_items(items):
+    """[(str id, encoding), ...] for a list of records with unique ids, else None."""
+    if not isinstance(items, list):
+        return None
+    out = []
+    seen = set()
+    for item in items:
+        if not isinstance(item, dict):
+            return None
+        iid = str(item.get("id"))
+        if iid in seen:
+            return None
+        seen.add(iid)
+        out.append((iid, _encode_section(item)))
+    return out
+
+def _join_items(items):
+    # same bytes orjson produces for the whole list
+    return b"[" + b",".join(enc for _, enc in items) + b"]"
+
+def _item_records(key, old, new):
+    """put_item/del_item records turning old into new, or None if only a whole-section put can (reordered list)."""
+    if old is None:
+        return None
+    old_map = dict(old)
+    new_ids = {iid for iid, _ in new}
+    kept = [iid for iid, _ in new if iid in old_map]
+    # survivors keep their order and come first; new items replay as appends
+    if [iid for iid, _ in old if iid in new_ids] != kept or [iid for iid, _ in new[:len(kept)]] != kept:
+        return None
+    records = [_wal_record("del_item", key, item_id=iid) for iid, _ in old if iid not in new_ids]
+    records.extend(_wal_record("put_item", key, enc, item_id=iid)
+                   for iid, enc in new if old_map.get(iid) != enc)
+    return records
+
+def _apply_item_record(data, rec):
+    items = data.get(rec["key"])
+    if not isinstance(items, list):
+        items = data[rec["key"]] = []
+    iid = rec.get("id")
+    pos = next((i for i, it in enumerate(items) if isinstance(it, dict) and str(it.get("id")) == iid), None)
+    if rec["op"] == "del_item":
+        if pos is not None:
+            del items[pos]
+    elif pos is None:
+        items.append(rec.get("value"))
+    else:
+        items[pos] = rec.get("value")
+
+def _wal_append(records, durable=False):
+    """Write length-prefixed records with a single write() call; returns the new WAL size."""
+    buf = b"".join(struct.pack(">I", len(r)) + r for r in records)
+    os.write(_WAL_FD, buf)
+    if durable:
+        os.fsync(_WAL_FD)
+    return os.fstat(_WAL_FD).st_size
+
+def _replay_wal(data, skip=()):
+    """Apply WAL records on top of a freshly loaded snapshot, except those for sections in skip.
+    Returns the number of records read."""
+    try:
+        with open(WAL_FILE, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return 0
+    applied = 0
+    pos = 0
+    while pos + 4 <= len(raw):
+        (size,) = struct.unpack(">I", raw[pos:pos + 4])
+        chunk = raw[pos + 4:pos + 4 + size]
+        if len(chunk) < size:
+            break  # torn write at the tail (crash mid-append) - ignore it
+        try:
+            rec = orjson.loads(chunk)
+        except orjson.JSONDecodeError:
+            break
+        op = rec.get("op")
+        if rec.get("key") in skip:
+            pass
+        elif op == "put":
+            data[rec["key"]] = rec.get("value")
+        elif op == "del":
+            data.pop(rec["key"], None)
+        elif op in ("put_item", "del_item"):
+            _apply_item_record(data, rec)
+        applied += 1
+        pos += 4 + size
+    return applied
+
+def _data_mtime():
+    try:
+        return os.stat(DATA_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 def load_data():
-    ensure_data_file()
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Return the shared in-memory data.
 
-def save_data(data):
-    """Save data to file with automatic backup before writing"""
-    # Create backup before saving (only if file exists and has data)
-    if os.path.exists(DATA_FILE):
+    Disk is only read on the first call, or when data.json was modified outside
+    this process (mtime check). In that case the sections edited by hand are
+    kept as they are on disk, and pending WAL records are replayed for all the
+    others, so neither the hand edit nor anything saved by the app is lost.
+    """
+    global _DATA_CACHE, _DATA_MTIME, _SAVE_GEN, _RETIRED
+    with _DATA_LOCK:
+        if _DATA_CACHE is None or _data_mtime() != _DATA_MTIME:
+            _SAVE_GEN += 1
+            if _DIRTY.is_set():
+                _flush_now()  # get pending saves into the WAL so the reload replays them
+            ensure_data_file()
+            data = _read_snapshot()
+            snapshot = {k: _encode_section(v) for k, v in data.items()}
+            edited = set()
+            if _DATA_CACHE is not None:
+                # external edit: the sections that differ from the file we last read/wrote
+                edited = {k for k in snapshot.keys() | _SNAPSHOT_BYTES.keys()
+                          if snapshot.get(k) != _SNAPSHOT_BYTES.get(k)}
+                _RETIRED = (_DATA_CACHE, dict(_SECTION_BYTES))
+                log.info("%s changed on disk; reloading (edited sections: %s)", DATA_FILE, sorted(edited))
+            _SNAPSHOT_BYTES.clear()
+            _SNAPSHOT_BYTES.update(snapshot)
+            replayed = _replay_wal(data, skip=edited)
+            _SECTION_BYTES.clear()
+            _ITEM_BYTES.clear()
+            for k, v in data.items():
+                items = _encode_items(v) if k in SHARDED_SECTIONS else None
+                if items is None:
+                    _SECTION_BYTES[k] = _encode_section(v)
+                else:
+                    _ITEM_BYTES[k] = items
+                    _SECTION_BYTES[k] = _join_items(items)
+            _DATA_CACHE = data
+            _seed_ids(data)
+            _DATA_MTIME = _data_mtime()
+            if replayed:
+                _compact()
+        return _DATA_CACHE
+
+def save_data(data, durable=False, sync=False):
+    """Make data the current state and schedule it for persistence.
+
+    Saves are coalesced: the background flusher writes the changed sections
+    FLUSH_DELAY after the first unflushed save. sync=True writes before
+    returning. durable=True makes the flush that carries this save fsync the
+    log (debate votes: one fsync per batch of votes, not per vote).
+    """
+    global _DATA_CACHE, _FSYNC_PENDING, _SAVE_GEN
+    with _DATA_LOCK:
+        if _DATA_CACHE is None:
+            _DATA_CACHE = data
+        elif data is not _DATA_CACHE:
+            _merge_retired(data)
+        _SAVE_GEN += 1
+        _INDEX.clear()  # sections are only diffed at flush time, so any index may be stale now
+        if durable:
+            _FSYNC_PENDING = True
+    if sync:
+        _flush_now()
+    else:
+        _DIRTY.set()
+
+def _merge_retired(data):
+    """
+    save_data() of a dict taken before an external-edit reload replaced it: copy
+    the sections that request changed onto the current data instead of making the
+    old dict current again (which would undo the edit on disk).
+    """
+    if _RETIRED is None or data is not _RETIRED[0]:
+        raise ValueError("save_data() got a dict that is not the current data; use load_data()")
+    before = _RETIRED[1]
+    for k, v in list(data.items()):
+        if _encode_section(v) != before.get(k):
+            _DATA_CACHE[k] = v
+    for k in before:
+        if k not in data:
+            _DATA_CACHE.pop(k, None)
+
+def _flush_now(durable=False):
+    """Persist only the sections (or, for SHARDED_SECTIONS, the items) changed since the last flush, as WAL records."""
+    global _DATA_VERSION, _COMPACTING, _FSYNC_PENDING
+    with _DATA_LOCK:
+        durable = durable or _FSYNC_PENDING
+        _FSYNC_PENDING = False
         try:
-            # Check if file has meaningful data (more than just empty structure)
-            with open(DATA_FILE, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
-                total_items = sum(len(v) if isinstance(v, list) else 1 for v in existing_data.values())
-                
-                # Only backup if file has data
-                if total_items > 0:
-                    backup_name = f"{DATA_FILE}.backup.{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    shutil.copy2(DATA_FILE, backup_name)
-                    # Keep only last 10 backups to avoid disk space issues
-                    try:
-                        backups = sorted(glob.glob(f"{DATA_FILE}.backup.*"), reverse=True)
-                        for old_backup in backups[10:]:  # Keep last 10
-                            try:
-                                os.remove(old_backup)
-                            except:
-                                pass
-                    except:
-                        pass
-        except:
-            # If we can't read existing file, still try to save (might be corrupted)
+            data = _DATA_CACHE
+            if data is None:
+                _DIRTY.clear()
+                return
+            changed = []  # (key, section encoding, item encodings or None)
+            # handlers add top-level keys without the lock: iterate over a copy
+            for k, v in list(data.items()):
+                items = _encode_items(v) if k in SHARDED_SECTIONS else None
+                enc = _encode_section(v) if items is None else _join_items(items)
+                if _SECTION_BYTES.get(k) != enc:
+                    changed.append((k, enc, items))
+            removed = [k for k in _SECTION_BYTES if k not in data]
+            if not changed and not removed:
+                if durable:
+                    os.fsync(_WAL_FD)  # an earlier, coalesced flush may have written this change
+                _DIRTY.clear()
+                return
+            _push_backup()
+            records = []
+            for k, enc, items in changed:
+                item_records = None if items is None else _item_records(k, _ITEM_BYTES.get(k), items)
+                if item_records is None:
+                    records.append(_wal_record("put", k, enc))
+                else:
+                    records.extend(item_records)
+            records.extend(_wal_record("del", k) for k in removed)
+            wal_size = _wal_append(records, durable)
+        except Exception:
+            # nothing was recorded as persisted: the next flush retries the whole batch
+            _DIRTY.set()
+            _FSYNC_PENDING = _FSYNC_PENDING or durable
+            raise
+        # only now, with the records on disk, count these encodings as persisted
+        _DIRTY.clear()
+        for k, enc, items in changed:
+            if items is None:
+                _ITEM_BYTES.pop(k, None)
+            else:
+                _ITEM_BYTES[k] = items
+            _SECTION_BYTES[k] = enc
+            _drop_indexes(k)
+        for k in removed:
+            del _SECTION_BYTES[k]
+            _ITEM_BYTES.pop(k, None)
+            _drop_indexes(k)
+        _DATA_VERSION += 1
+        if wal_size > WAL_COMPACT_BYTES and not _COMPACTING:
+            _COMPACTING = True
+            threading.Thread(target=_compact, daemon=True).start()
+
+def _flush_loop():
+    while True:
+        _DIRTY.wait()
+        time.sleep(FLUSH_DELAY)  # let saves that land in the meantime share this write
+        try:
+            _flush_now()
+        except Exception:
+            log.exception("background flush of %s", DATA_FILE)
+
+def _push_backup():
+    """Keep the pre-save document in _BACKUP_RING, at most once per BACKUP_MIN_INTERVAL and only if it holds data."""
+    global _LAST_BACKUP_AT
+    now = time.monotonic()
+    if now - _LAST_BACKUP_AT < BACKUP_MIN_INTERVAL:
+        return
+    # cheap size check instead of parsing/counting items: an empty structure is ~100 bytes
+    if sum(map(len, _SECTION_BYTES.values())) <= _EMPTY_DATA_BYTES:
+        return
+    _BACKUP_RING.append((datetime.datetime.now().strftime('%Y%m%d_%H%M%S_%f'), _snapshot_bytes()))
+    _LAST_BACKUP_AT = now
+
+def _snapshot_bytes():
+    """The whole document as JSON, joined from the per-section encodings already in _SECTION_BYTES."""
+    return b"{" + b",".join(orjson.dumps(k) + b":" + v for k, v in _SECTION_BYTES.items()) + b"}"
+
+def _compact():
+    """Rewrite DATA_FILE from memory and truncate the WAL."""
+    global _DATA_MTIME, _COMPACTING
+    with _DATA_LOCK:
+        try:
+            if _DATA_CACHE is not None:
+                sections = {k: _encode_section(v) for k, v in list(_DATA_CACHE.items())}
+                _atomic_write(DATA_FILE, b"{" + b",".join(orjson.dumps(k) + b":" + v for k, v in sections.items()) + b"}")
+                _SNAPSHOT_BYTES.clear()
+                _SNAPSHOT_BYTES.update(sections)
+                os.ftruncate(_WAL_FD, 0)
+                _DATA_MTIME = _data_mtime()
+        finally:
+            _COMPACTING = False
+
+_FLUSHER = threading.Thread(target=_flush_loop, name="data-flusher", daemon=True)
+_FLUSHER.start()
+
+# ---------- In-memory lookup indexes ----------
+# name -> (section, key function). Built lazily from the cached data and dropped
+# by save_data() whenever their section changes.
+_INDEX_SPECS = {
+    "members_by_email": ("members", lambda m: _norm_email(m.get("email"))),
+    "meetings_by_id": ("meetings", lambda m: str(m.get("id"))),
+    "kpi_categories_by_id": ("kpi_categories", lambda c: c.get("id")),
+    "debates_by_id": ("debates", lambda d: str(d.get("id"))),
+    "quizzes_by_id": ("quizzes", lambda q: str(q.get("id"))),
+    "quiz_sessions_by_id": ("quiz_sessions", lambda s: str(s.get("id"))),
+    "feedback_forms_by_id": ("feedback_forms", lambda f: str(f.get("id"))),
+    "points_by_id": ("points_entries", lambda e: e.get("id")),
+    "criteria_by_id": ("points_criteria", lambda c: c.get("id")),
+    # (email, criteria, meeting_id, debate_id): one automatic award per member and event
+    "points_by_event": ("points_entries",
+                        lambda e: (e.get("member_email"), e.get("criteria"), e.get("meeting_id"), e.get("debate_id"))),
+}
+_INDEX = {}  # name -> (source list, its len at build time, {key: item})
+
+def _index(data, name):
+    section, key_of = _INDEX_SPECS[name]
+    items = data.get(section) or []
+    with _DATA_LOCK:
+        cached = _INDEX.get(name)
+        # also rebuild if the list was replaced or grew/shrank since the last save
+        if cached and cached[0] is items and cached[1] == len(items):
+            return cached[2]
+        idx = {}
+        for it in items:
+            idx.setdefault(key_of(it), it)  # first match wins, like the old linear scans
+        _INDEX[name] = (items, len(items), idx)
+        return idx
+
+def _index_append(data, name, item):
+    """data[section].append(item), updating a current index in place instead of forcing a rebuild."""
+    section, key_of = _INDEX_SPECS[name]
+    items = data.setdefault(section, [])
+    with _DATA_LOCK:
+        cached = _INDEX.get(name)
+        fresh = cached and cached[0] is items and cached[1] == len(items)
+        items.append(item)
+        if fresh:
+            cached[2].setdefault(key_of(item), item)
+            _INDEX[name] = (items, len(items), cached[2])
+
+def _index_remove(data, name, key):
+    """Remove and return the item the index maps key to (None if absent). The list keeps its order."""
+    item = _index(data, name).get(key)
+    if item is None:
+        return None
+    items = data[_INDEX_SPECS[name][0]]
+    # position by identity: no dict == comparisons against the other records
+    del items[next(i for i, it in enumerate(items) if it is item)]
+    return item
+
+_LOCKS = {}  # ("meeting" | "debate", id) -> Lock around read-modify-write of that one record
+
+def _entity_lock(kind, eid):
+    return _LOCKS.setdefault((kind, str(eid)), threading.Lock())
+
+_ID_LOCK = threading.Lock()
+_LAST_ID = 0
+
+def _new_id():
+    """Millisecond-timestamp id, bumped by one if needed so ids from the same ms stay unique."""
+    global _LAST_ID
+    with _ID_LOCK:
+        _LAST_ID = max(time.time_ns() // 1_000_000, _LAST_ID + 1)
+        return _LAST_ID
+
+def _seed_ids(data):
+    """Make _new_id() start above every integer id already stored (e.g. ones written with a clock ahead of ours)."""
+    global _LAST_ID
+    top = max((it["id"] for v in data.values() if isinstance(v, list)
+               for it in v if isinstance(it, dict) and type(it.get("id")) is int), default=0)
+    with _ID_LOCK:
+        _LAST_ID = max(_LAST_ID, top)
+
+def _drop_indexes(section):
+    for name, (sec, _) in _INDEX_SPECS.items():
+        if sec == section:
+            _INDEX.pop(name, None)
+
+def _scan_prefixed(directory, prefix):
+    """One os.scandir pass over directory; returns the file entries whose name starts with prefix."""
+    try:
+        with os.scandir(directory) as it:
+            return [e for e in it if e.name.startswith(prefix) and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+def _existing_backups():
+    folder = os.path.dirname(DATA_FILE) or "."
+    entries = _scan_prefixed(folder, os.path.basename(DATA_FILE) + ".backup.")
+    # names end in %Y%m%d_%H%M%S[_%f], so name order is age order
+    return [os.path.join(folder, e.name) if folder != "." else e.name
+            for e in sorted(entries, key=lambda e: e.name)]
+
+MAX_BACKUP_FILES = 10
+_BACKUP_LIST = deque(_existing_backups())  # backup files on disk, oldest first; one scan at startup
+
+def _atomic_write(path, payload):
+    """Write payload to a temp file next to path, fsync it, then os.replace() it over path - readers see the old or the new file, never half of one."""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"  # two writers of one path never share a temp file
+    try:
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
             pass
-    
-    # Save data
-    try:
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        # If save fails, try to restore from backup
-        backups = sorted(glob.glob(f"{DATA_FILE}.backup.*"), reverse=True)
-        if backups:
-            print(f"ERROR saving {DATA_FILE}: {e}. Attempting to restore from latest backup...")
-            try:
-                shutil.copy2(backups[0], DATA_FILE)
-                print(f"Restored from backup: {backups[0]}")
-            except:
-                pass
-        raise e
+        raise
+
+def spill_backup_ring():
+    """Write the in-memory backups to data.json.backup.<ts> files (keeping the newest MAX_BACKUP_FILES on disk)."""
+    with _DATA_LOCK:
+        pending = list(_BACKUP_RING)
+        _BACKUP_RING.clear()
+    written = []
+    for stamp, payload in pending:
+        name = f"{DATA_FILE}.backup.{stamp}"
+        try:
+            with open(name, "wb") as f:
+                f.write(payload)
+            written.append(name)
+        except Exception:
+            log.exception("writing backup %s", name)
+            continue
+        with _DATA_LOCK:
+            _BACKUP_LIST.append(name)
+            while len(_BACKUP_LIST) > MAX_BACKUP_FILES:
+                try:
+                    os.remove(_BACKUP_LIST.popleft())
+                except OSError:
+                    pass
+    return written
+
+atexit.register(spill_backup_ring)
+atexit.register(_flush_now)  # runs first (atexit is LIFO), so its backup entry gets spilled too
 
 # ---------- UI ----------
 @app.route("/")
@@ -168,7 +624,7 @@ def debate_page():
 def live_page(did):
     # just template; data is fetched via API from frontend
     data = load_data()
-    debate = next((d for d in data.get("debates", []) if str(d.get("id")) == str(did)), None)
+    debate = _debate_by_id(data, did)
     if not debate:
         abort(404)
     # optional: if not finished and not yet live, mark it live here
@@ -179,13 +635,6 @@ def live_page(did):
         live["active"] = True
         live["started_at"] = live.get("started_at") or int(time.time())
         debate["live"] = live
-        # persist
-        debates = data.get("debates", [])
-        for i, db in enumerate(debates):
-            if str(db.get("id")) == str(did):
-                debates[i] = debate
-                break
-        data["debates"] = debates
         save_data(data)
     return render_template("live.html", did=str(did))
 
@@ -206,11 +655,11 @@ def members():
             data["members"].append({
                 "name": name, "email": email, "studio": studio, "status": status, "clan_lead": clan_lead, "external": payload.get("external", False)
             })
-            save_data(data)
+            save_data(data, sync=True)
             return jsonify({"status": "saved"}), 200
         return jsonify(data.get("members", []))
     except Exception as e:
-        print("ERROR /api/members:", e)
+        log.exception("/api/members")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/members/<int:member_id>", methods=["PUT", "DELETE"])
@@ -223,24 +672,23 @@ def modify_member(member_id: int):
 
         if request.method == "PUT":
             payload = request.json or {}
-            members[member_id]["name"] = payload.get("name", members[member_id]["name"])
-            members[member_id]["email"] = (payload.get("email", members[member_id]["email"]) or "").lower()
-            members[member_id]["studio"] = payload.get("studio", members[member_id]["studio"])
-            members[member_id]["status"] = payload.get("status", members[member_id]["status"])
-            members[member_id]["clan_lead"] = payload.get("clan_lead", members[member_id].get("clan_lead", False))
-            members[member_id]["external"] = payload.get("external", members[member_id].get("external", False))
-            data["members"] = members
+            m = members[member_id]  # updated in place, it is the dict stored in data["members"]
+            m["name"] = payload.get("name", m["name"])
+            m["email"] = (payload.get("email", m["email"]) or "").lower()
+            m["studio"] = payload.get("studio", m["studio"])
+            m["status"] = payload.get("status", m["status"])
+            m["clan_lead"] = payload.get("clan_lead", m.get("clan_lead", False))
+            m["external"] = payload.get("external", m.get("external", False))
             save_data(data)
             return jsonify({"status": "updated"}), 200
 
         # DELETE
         removed = members.pop(member_id)
-        data["members"] = members
         save_data(data)
         return jsonify({"status": "deleted", "removed": removed}), 200
 
     except Exception as e:
-        print("ERROR PUT/DELETE /api/members/<id>:", e)
+        log.exception("PUT/DELETE /api/members/<id>")
         return jsonify({"error": str(e)}), 500
 
 # ---------- KPI CRUD ----------
@@ -254,7 +702,7 @@ def init_kpis():
         save_data(data)
         return jsonify({"status": "initialized"}), 200
     except Exception as e:
-        print("ERROR /api/kpis/init:", e)
+        log.exception("/api/kpis/init")
         return jsonify({"error": str(e)}), 500
 
 # Categories CRUD
@@ -286,7 +734,7 @@ def kpi_categories():
         
         return jsonify(data.get("kpi_categories", []))
     except Exception as e:
-        print("ERROR /api/kpi-categories:", e)
+        log.exception("/api/kpi-categories")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/kpi-categories/<int:category_id>", methods=["PUT", "DELETE"])
@@ -294,7 +742,7 @@ def modify_kpi_category(category_id: int):
     try:
         data = load_data()
         categories = data.get("kpi_categories", [])
-        category = next((c for c in categories if c.get("id") == category_id), None)
+        category = _index(data, "kpi_categories_by_id").get(category_id)
         
         if not category:
             return jsonify({"error": "Category not found"}), 404
@@ -314,7 +762,7 @@ def modify_kpi_category(category_id: int):
         return jsonify({"status": "deleted"}), 200
 
     except Exception as e:
-        print("ERROR PUT/DELETE /api/kpi-categories/<id>:", e)
+        log.exception("PUT/DELETE /api/kpi-categories/<id>")
         return jsonify({"error": str(e)}), 500
 
 # KPI items CRUD within a category
@@ -322,8 +770,7 @@ def modify_kpi_category(category_id: int):
 def add_kpi_to_category(category_id: int):
     try:
         data = load_data()
-        categories = data.get("kpi_categories", [])
-        category = next((c for c in categories if c.get("id") == category_id), None)
+        category = _index(data, "kpi_categories_by_id").get(category_id)
         
         if not category:
             return jsonify({"error": "Category not found"}), 404
@@ -345,15 +792,14 @@ def add_kpi_to_category(category_id: int):
         return jsonify({"status": "saved", "kpi": new_kpi}), 200
         
     except Exception as e:
-        print("ERROR POST /api/kpi-categories/<id>/kpis:", e)
+        log.exception("POST /api/kpi-categories/<id>/kpis")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/kpi-categories/<int:category_id>/kpis/<int:kpi_id>", methods=["PUT", "DELETE"])
 def modify_kpi_in_category(category_id: int, kpi_id: int):
     try:
         data = load_data()
-        categories = data.get("kpi_categories", [])
-        category = next((c for c in categories if c.get("id") == category_id), None)
+        category = _index(data, "kpi_categories_by_id").get(category_id)
         
         if not category:
             return jsonify({"error": "Category not found"}), 404
@@ -383,7 +829,7 @@ def modify_kpi_in_category(category_id: int, kpi_id: int):
         return jsonify({"status": "deleted"}), 200
 
     except Exception as e:
-        print("ERROR PUT/DELETE /api/kpi-categories/<id>/kpis/<id>:", e)
+        log.exception("PUT/DELETE /api/kpi-categories/<id>/kpis/<id>")
         return jsonify({"error": str(e)}), 500
 
 # ---------- Meetings CRUD ----------
@@ -394,7 +840,7 @@ def meetings():
         if request.method == "POST":
             payload = request.json or {}
             m = {
-                "id": int(time.time() * 1000),
+                "id": _new_id(),
                 "title": payload.get("title", ""),
                 "date": payload.get("date", ""),
                 "topic": payload.get("topic", ""),
@@ -405,6 +851,7 @@ def meetings():
             }
             data["meetings"].append(m)
             save_data(data)
+            _participants_by_email_map(m)  # index invitees now, not on the first check-in
             return jsonify({"status": "saved", "id": m["id"]}), 200
 
         if request.method == "PUT":
@@ -412,12 +859,12 @@ def meetings():
             mid = payload.get("id")
             if not mid:
                 return jsonify({"error": "Missing id"}), 400
-            for idx, mt in enumerate(data.get("meetings", [])):
-                if str(mt.get("id")) == str(mid):
-                    data["meetings"][idx].update({k: v for k, v in payload.items() if k != "id"})
-                    save_data(data)
-                    return jsonify({"status": "updated"}), 200
-            return jsonify({"error": "Meeting not found"}), 404
+            mt = _meeting_by_id(data, mid)
+            if not mt:
+                return jsonify({"error": "Meeting not found"}), 404
+            mt.update({k: v for k, v in payload.items() if k != "id"})
+            save_data(data)
+            return jsonify({"status": "updated"}), 200
 
         if request.method == "DELETE":
             mid = request.args.get("id")
@@ -425,7 +872,7 @@ def meetings():
                 return jsonify({"error": "Missing id"}), 400
             
             # Remove associated points entries for this meeting
-            points_entries = data.get("points_entries", [])
+            points_entries = data["points_entries"]
             data["points_entries"] = [entry for entry in points_entries if entry.get("meeting_id") != int(mid)]
             
             # Remove the meeting
@@ -433,51 +880,151 @@ def meetings():
             ms = [m for m in ms if str(m.get("id")) != str(mid)]
             data["meetings"] = ms
             save_data(data)
+            with _DATA_LOCK:
+                _PARTICIPANTS_INDEX.pop(str(mid), None)
             return jsonify({"status": "deleted"}), 200
 
         # GET
         return jsonify(data.get("meetings", []))
 
     except Exception as e:
-        print("ERROR /api/meetings:", e)
+        log.exception("/api/meetings")
         return jsonify({"error": str(e)}), 500
 
 # ---------- Helpers pentru QR & lookup ----------
+@functools.lru_cache(maxsize=4096)
+def _norm_email(email):
+    """Lowercased, trimmed email ("" for None); the same few hundred addresses recur across every award/leaderboard pass."""
+    return (email or "").strip().lower()
+
 def _member_by_email(data, email):
-    email = (email or "").strip().lower()
-    for m in data.get("members", []):
-        if (m.get("email") or "").strip().lower() == email:
-            return m
-    return None
+    return _index(data, "members_by_email").get(_norm_email(email))
 
 def _studio_of(data, email):
     m = _member_by_email(data, email) or {}
     return (m.get("studio") or "").strip().upper()
 
+_PARTICIPANTS_INDEX = {}  # meeting id -> (participants list, its len at build time, {email: participant})
+
 def _participants_by_email_map(meeting):
-    out = {}
-    for p in (meeting.get("participants") or []):
-        em = (p.get("email") or "").strip().lower()
-        if em:
-            out[em] = p
-    return out
+    """
+    {lowercased email: participant} for a meeting. Participants stay a list in
+    data.json (the UI depends on it); the map is cached per meeting and rebuilt
+    only when the list is replaced or changes length.
+    """
+    parts = meeting.get("participants") or []
+    key = str(meeting.get("id"))
+    with _DATA_LOCK:
+        cached = _PARTICIPANTS_INDEX.get(key)
+        if cached and cached[0] is parts and cached[1] == len(parts):
+            return cached[2]
+        out = {}
+        for p in parts:
+            em = _norm_email(p.get("email"))
+            if em:
+                out[em] = p
+        _PARTICIPANTS_INDEX[key] = (parts, len(parts), out)
+        return out
 
 def _meeting_by_id(data, mid):
-    return next((m for m in data.get("meetings", []) if str(m.get("id")) == str(mid)), None)
+    return _index(data, "meetings_by_id").get(str(mid))
 
+def _debate_by_id(data, did):
+    return _index(data, "debates_by_id").get(str(did))
+
+def _feedback_form_by_id(data, fid):
+    return _index(data, "feedback_forms_by_id").get(str(fid))
+
+_QR_POOL = threading.local()
+
+def _get_qr():
+    """This thread's reusable QRCode encoder (same settings as qrcode.make())."""
+    q = getattr(_QR_POOL, "q", None)
+    if q is None:
+        q = _QR_POOL.q = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_M)
+    return q
+
+@functools.lru_cache(maxsize=512)
+def _qr_png_for(url):
+    """
+    Content-addressed QR PNG for url: static/qr_<sha1[:16]>.png.
+    The image is only rendered when that file is not on disk yet.
+    Returns (fname, sha1 hexdigest).
+    """
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    fname = f"static/qr_{digest[:16]}.png"
+    if not os.path.exists(fname):
+        os.makedirs("static", exist_ok=True)
+        q = _get_qr()
+        q.clear()
+        q.version = None  # clear() keeps the last fitted size; refit for this url
+        q.add_data(url)
+        q.make(fit=True)
+        buf = io.BytesIO()
+        q.make_image().save(buf)
+        # the name alone means "already rendered" (and is served as immutable): never leave half a PNG there
+        _atomic_write(fname, buf.getvalue())
+    return fname, digest
+
+@functools.lru_cache(maxsize=512)
 def _versioned_qr_png(url, prefix):
     """
-    Creates a new version PNG QR (avoids cache) and returns (qr_url, ts).
+    Returns (qr_url, ts) for a QR PNG of url. The same url always maps to the
+    same file, so repeat calls reuse it instead of re-encoding; the ?v= part
+    changes with the url and keeps browser caches correct.
+    Memoized: ts is when this (url, prefix) was first generated in this process,
+    so regenerating an unchanged QR leaves the stored debate/meeting untouched.
     """
     ts = int(time.time() * 1000)  # Use milliseconds for better uniqueness
-    img = qrcode.make(url)
-    os.makedirs("static", exist_ok=True)
-    fname = f"static/{prefix}_{ts}.png"
-    img.save(fname)
-    # Add cache-busting parameter to URL
-    qr_url = f"/{fname}?v={ts}"
+    fname, digest = _qr_png_for(url)
+    _prune_legacy_qrs(prefix)
+    qr_url = f"/{fname}?v={digest[:8]}"
     return (qr_url, ts)
 
+@app.after_request
+def _cache_qr_pngs(resp):
+    # static/qr_<sha1 of url>.png never changes once written: let browsers keep it
+    if resp.status_code == 200 and request.path.startswith("/static/qr_"):
+        resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return resp
+
+_QR_PRUNED = set()  # prefixes already cleaned in this process
+
+def _prune_legacy_qrs(prefix, keep=2):
+    """
+    Older versions wrote static/{prefix}_{ts}.png on every call. Delete all but
+    the newest `keep` of those, once per prefix, in a single scandir pass.
+    """
+    if prefix in _QR_PRUNED:
+        return
+    _QR_PRUNED.add(prefix)
+    try:
+        old = [e for e in _scan_prefixed("static", prefix + "_") if e.name.endswith(".png")]
+        old.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        for e in old[keep:]:
+            try:
+                os.unlink(e.path)
+            except OSError:
+                pass
+    except Exception as e:
+        log.warning("prune_legacy_qrs: %s", e)
+
+_QR_EXEC = ThreadPoolExecutor(max_workers=4, thread_name_prefix="qr")
+
+def _render_qrs(jobs):
+    """
+    _versioned_qr_png(url, prefix) for every (url, prefix) in jobs, results in
+    the same order. Several PNGs are encoded in parallel on _QR_EXEC (PIL's
+    zlib step releases the GIL); a single one is rendered inline.
+    """
+    if len(jobs) < 2:
+        return [_versioned_qr_png(url, prefix) for url, prefix in jobs]
+    try:
+        futures = [_QR_EXEC.submit(_versioned_qr_png, url, prefix) for url, prefix in jobs]
+    except RuntimeError:  # pool already shut down (interpreter exit)
+        return [_versioned_qr_png(url, prefix) for url, prefix in jobs]
+    return [f.result() for f in futures]
+
 # ---------- QR check-in pentru meeting (existent) ----------
 @app.route("/api/meetings/<mid>/qr", methods=["POST"])
 def meeting_qr(mid):
@@ -486,9 +1033,20 @@ def meeting_qr(mid):
         qr_url, _ = _versioned_qr_png(checkin_url, f"qr_{mid}")
         return jsonify({"qr_url": qr_url, "checkin_url": checkin_url})
     except Exception as e:
-        print("ERROR /api/meetings/<mid>/qr:", e)
+        log.exception("/api/meetings/<mid>/qr")
         return jsonify({"error": str(e)}), 500
 
+@functools.lru_cache(maxsize=None)
+def _static_page(template):
+    """Bytes of a template that takes no variables, rendered once per process."""
+    return render_template(template).encode("utf-8")
+
+@functools.lru_cache(maxsize=None)
+def _static_page_gz(template):
+    """gzip-compressed _static_page(template) and its ETag, computed once per process."""
+    body = _static_page(template)
+    return gzip.compress(body), hashlib.blake2b(body, digest_size=12).hexdigest()
+
 @app.route("/api/meetings/<mid>/checkin", methods=["GET", "POST"])
 def meeting_checkin(mid):
     """
@@ -496,20 +1054,10 @@ def meeting_checkin(mid):
     """
     try:
         data = load_data()
-        meetings = data.get("meetings", [])
-        meeting = next((m for m in meetings if str(m.get("id")) == str(mid)), None)
+        meeting = _meeting_by_id(data, mid)
 
         if not meeting:
-            html = """
-            <html><head><meta name="viewport" content="width=device-width, initial-scale=1" />
-            <style>
-              body{font-family:Arial,sans-serif;background:#f6f7fb;margin:0;padding:24px}
-              .card{max-width:560px;margin:0 auto;background:#fff;border:1px solid #eaedf4;border-radius:12px;padding:18px}
-              h2{margin:0 0 6px 0}.muted{color:#667}
-            </style></head>
-            <body><div class="card"><h2>Meeting not found</h2></div></body></html>
-            """
-            return html, 404
+            return _static_page("checkin_not_found.html"), 404
 
         def want_json():
             if (request.args.get("format") or "").lower() == "json":
@@ -524,88 +1072,28 @@ def meeting_checkin(mid):
             email = (request.args.get("email") or "").strip().lower()
 
         if not email:
-            title = escape(meeting.get("title") or "QA Meeting")
-            date = escape(meeting.get("date") or "")
-            html = f"""
-            <html><head><meta name="viewport" content="width=device-width, initial-scale=1" />
-            <style>
-              body{{font-family:Arial,sans-serif;background:#f6f7fb;margin:0;padding:24px}}
-              .card{{max-width:560px;margin:0 auto;background:#fff;border:1px solid #eaedf4;border-radius:12px;padding:18px}}
-              h2{{margin:0 0 6px 0}} .muted{{color:#667}}
-              form{{margin-top:12px}} input{{width:100%;padding:10px;border:1px solid #d7dbe5;border-radius:8px}}
-              .btn{{margin-top:10px;background:#1d2233;color:#fff;border:none;border-radius:8px;padding:10px 14px;cursor:pointer;width:100%}}
-            </style></head>
-            <body>
-              <div class="card">
-                <h2>QR Check-in</h2>
-                <div class="muted">{title} • {date}</div>
-                <form method="GET">
-                  <label for="email">Enter your email address:</label>
-                  <input id="email" name="email" type="email" placeholder="prenume.nume@companie.com" required />
-                  <button class="btn" type="submit">Confirm attendance</button>
-                </form>
-              </div>
-            </body></html>
-            """
-            return html
-
-        invited = None
-        for p in meeting.get("participants", []):
-            if (p.get("email") or "").strip().lower() == email:
-                invited = p
-                break
+            return render_template("checkin_form.html", title=meeting.get("title") or "QA Meeting", date=meeting.get("date") or "")
+
+        invited = _participants_by_email_map(meeting).get(email)
 
         if not invited:
             if want_json():
                 return jsonify({"error": "Email is not in the invite list"}), 404
-            html = """
-            <html><head><meta name="viewport" content="width=device-width, initial-scale=1" />
-            <style>
-              body{font-family:Arial,sans-serif;background:#f6f7fb;margin:0;padding:24px}
-              .card{max-width:560px;margin:0 auto;background:#fff;border:1px solid #eaedf4;border-radius:12px;padding:18px}
-              h2{margin:0 0 6px 0}.muted{color:#a33}
-              a.btn{display:inline-block;margin-top:10px;background:#1d2233;color:#fff;text-decoration:none;border-radius:8px;padding:10px 14px}
-            </style></head>
-            <body><div class="card"><h2>You are not in the invite list</h2></div></body></html>
-            """
-            return html, 404
-
-        invited["present"] = True
-        for i, m in enumerate(meetings):
-            if str(m.get("id")) == str(mid):
-                meetings[i] = meeting
-                break
-        data["meetings"] = meetings
-        save_data(data)
-        
-        # Award attendance points
-        award_meeting_attendance_points(meeting)
+            return _static_page("checkin_not_invited.html"), 404
+
+        with _entity_lock("meeting", mid):
+            invited["present"] = True  # invited lives inside data["meetings"], no write-back needed
+            # Award attendance points (same snapshot, one save)
+            award_meeting_attendance_points(meeting, data)
+            save_data(data)
 
         if want_json():
             return jsonify({"status": "checked_in", "email": email}), 200
 
-        title = escape(meeting.get("title") or "QA Meeting")
-        date = escape(meeting.get("date") or "")
-        html = f"""
-        <html><head><meta name="viewport" content="width=device-width, initial-scale=1" />
-        <style>
-          body{{font-family:Arial,sans-serif;background:#f6f7fb;margin:0;padding:24px}}
-          .card{{max-width:560px;margin:0 auto;background:#fff;border:1px solid #eaedf4;border-radius:12px;padding:18px;text-align:center}}
-          h2{{margin:0 0 6px 0}} .ok{{color:#166534}}
-          .muted{{color:#667}}
-        </style></head>
-        <body>
-          <div class="card">
-            <h2 class="ok">Check-in confirmed ✅</h2>
-            <div class="muted">{title} • {date}</div>
-            <p>Thank you! Your attendance has been recorded.</p>
-          </div>
-        </body></html>
-        """
-        return html
+        return render_template("checkin_ok.html", title=meeting.get("title") or "QA Meeting", date=meeting.get("date") or "")
 
     except Exception as e:
-        print("ERROR /api/meetings/<mid>/checkin:", e)
+        log.exception("/api/meetings/<mid>/checkin")
         if (request.args.get("format") or "").lower() == "json":
             return jsonify({"error": str(e)}), 500
         return make_response("An error occurred. Please try again.", 500)
@@ -621,6 +1109,33 @@ def _ensure_live_shape(debate: dict):
     debate["live"] = live
     return debate
 
+def _subdict(parent, key):
+    """parent[key] if it is a dict, else a new {} stored at parent[key]."""
+    child = parent.get(key)
+    if not isinstance(child, dict):
+        child = parent[key] = {}
+    return child
+
+_RUBRIC_BY_ROUND = {}  # debate id -> (rubric list, its len at build time, {round: [criteria]})
+
+def _rubric_for_round(debate, rnd):
+    """
+    General criteria plus the "round" criteria of round rnd, in rubric order.
+    Cached per debate; dropped when the rubric list is replaced (PUT) or resized.
+    """
+    all_rubric = debate.get("rubric") or []
+    key = str(debate.get("id"))
+    cached = _RUBRIC_BY_ROUND.get(key)
+    if not cached or cached[0] is not all_rubric or cached[1] != len(all_rubric):
+        cached = (all_rubric, len(all_rubric), {})
+        _RUBRIC_BY_ROUND[key] = cached
+    by_round = cached[2]
+    if rnd not in by_round:
+        by_round[rnd] = [c for c in all_rubric
+                         if c.get("type", "general") == "general"
+                         or (c.get("type", "general") == "round" and c.get("round", "1") == rnd)]
+    return by_round[rnd]
+
 def _gen_step_qrs_for_debate(debate):
     """
     For each step in flow with action in {"jury_vote","public_vote"}:
@@ -631,26 +1146,28 @@ def _gen_step_qrs_for_debate(debate):
     try:
         did = debate.get("id")
         flow = debate.get("flow") or []
+        # URLs are built here on the request thread (url_for needs the request
+        # context); only the PNG rendering goes to the pool.
+        plan = []  # (step, type, [(link, prefix), ...])
         for i, st in enumerate(flow):
             action = (st.get("action") or "none").lower()
             if action not in ("jury_vote", "simple_jury_vote", "public_vote", "jury+public", "simple_jury+public"):
                 st.pop("qr", None)
                 continue
-            
-            if action in ("jury_vote", "simple_jury_vote"):
-                link = url_for("jury_vote_page", did=did, _external=True) + f"?step={i}"
-                qr_url, ts = _versioned_qr_png(link, f"qr_stepjury_{did}_{i}")
-                st["qr"] = {"url": link, "qr_url": qr_url, "ts": ts, "type": "jury"}
-            elif action == "public_vote":
-                link = url_for("public_vote_page", did=did, _external=True) + f"?step={i}"
-                qr_url, ts = _versioned_qr_png(link, f"qr_steppub_{did}_{i}")
-                st["qr"] = {"url": link, "qr_url": qr_url, "ts": ts, "type": "public"}
-            elif action in ("jury+public", "simple_jury+public"):
+            jobs = []
+            if action != "public_vote":
+                jobs.append((url_for("jury_vote_page", did=did, _external=True) + f"?step={i}", f"qr_stepjury_{did}_{i}"))
+            if action not in ("jury_vote", "simple_jury_vote"):
+                jobs.append((url_for("public_vote_page", did=did, _external=True) + f"?step={i}", f"qr_steppub_{did}_{i}"))
+            kind = "jury+public" if len(jobs) == 2 else ("public" if action == "public_vote" else "jury")
+            plan.append((st, kind, jobs))
+
+        rendered = iter(_render_qrs([job for _, _, jobs in plan for job in jobs]))
+        for st, kind, jobs in plan:
+            out = [(link,) + next(rendered) for link, _ in jobs]
+            if kind == "jury+public":
                 # Generate both jury and public QR codes
-                jury_link = url_for("jury_vote_page", did=did, _external=True) + f"?step={i}"
-                public_link = url_for("public_vote_page", did=did, _external=True) + f"?step={i}"
-                jury_qr_url, jury_ts = _versioned_qr_png(jury_link, f"qr_stepjury_{did}_{i}")
-                public_qr_url, public_ts = _versioned_qr_png(public_link, f"qr_steppub_{did}_{i}")
+                (jury_link, jury_qr_url, jury_ts), (public_link, public_qr_url, public_ts) = out
                 st["qr"] = {
                     "url": jury_link,  # Default to jury link for compatibility
                     "qr_url": jury_qr_url,  # Default to jury QR for compatibility
@@ -659,61 +1176,65 @@ def _gen_step_qrs_for_debate(debate):
                     "jury": {"url": jury_link, "qr_url": jury_qr_url, "ts": jury_ts},
                     "public": {"url": public_link, "qr_url": public_qr_url, "ts": public_ts}
                 }
+            else:
+                link, qr_url, ts = out[0]
+                st["qr"] = {"url": link, "qr_url": qr_url, "ts": ts, "type": kind}
         debate["flow"] = flow
     except Exception as e:
-        print("WARN gen_step_qrs:", e)
+        log.warning("gen_step_qrs: %s", e)
+
+def _score_value(v):
+    """float(v) for numeric-looking score values, None otherwise."""
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
 
 def _compute_totals(debate: dict):
     """Calculates team totals from current scores (jury rubric + public)."""
-    totals = {}
+    totals = defaultdict(float)
     for t in debate.get("teams", []) or []:
         tid = t.get("id")
         if tid:
             totals[tid] = 0.0
 
+    is_num = (int, float)
     scores = debate.get("scores") or {}
-    jury = scores.get("jury") or {}
-    for step_map in jury.values():
+    for step_map in (scores.get("jury") or {}).values():
         for judge_map in (step_map or {}).values():
             for team_id, crits in (judge_map or {}).items():
-                if "default" in crits:
-                    # Simple team choice - give 1 point
-                    try:
-                        totals[team_id] = totals.get(team_id, 0.0) + float(crits["default"])
-                    except Exception:
-                        pass
-                else:
-                    # Rubric scoring
-                    for v in (crits or {}).values():
-                        try:
-                            totals[team_id] = totals.get(team_id, 0.0) + float(v)
-                        except Exception:
-                            pass
-
-    public = scores.get("public") or {}
-    for step_map in public.values():
+                if not crits:
+                    continue
+                # Simple team choice ("default": 1) or rubric scoring (one value per criterion)
+                values = (crits["default"],) if "default" in crits else crits.values()
+                for v in values:
+                    if not isinstance(v, is_num):
+                        v = _score_value(v)
+                        if v is None:
+                            continue
+                    totals[team_id] += v
+
+    for step_map in (scores.get("public") or {}).values():
         if not step_map:
             continue
-        
-        # Find team with most public votes for this step
-        team_votes = {}
+        # Give 1 point to team(s) with most public votes for this step only
+        best = 0.0
+        winners = []
         for team_id, val in step_map.items():
             if team_id == "_voters":
                 continue
-            try:
-                team_votes[team_id] = float(val)
-            except Exception:
-                pass
-        
-        if team_votes:
-            # Give 1 point to team(s) with most votes for this step only
-            max_votes = max(team_votes.values()) if team_votes else 0
-            if max_votes > 0:
-                for team_id, votes in team_votes.items():
-                    if votes == max_votes:
-                        totals[team_id] = totals.get(team_id, 0.0) + 1.0
+            v = val if isinstance(val, is_num) else _score_value(val)
+            if v is None:
+                continue
+            if v > best:
+                best = v
+                winners = [team_id]
+            elif v == best and best > 0:
+                winners.append(team_id)
+        for team_id in winners:
+            totals[team_id] += 1.0
 
-    return totals
+    return dict(totals)
 
 # ---------- Debates CRUD (Flow + rubric + format + signups + scores) ----------
 @app.route("/api/debates", methods=["GET", "POST", "PUT", "DELETE"])
@@ -725,7 +1246,7 @@ def debates():
         if request.method == "POST":
             p = request.json or {}
             d = {
-                "id": int(time.time() * 1000),
+                "id": _new_id(),
                 "affirmation": p.get("affirmation", ""),
                 "meeting_id": p.get("meeting_id"),
                 "prize": p.get("prize", ""),
@@ -760,23 +1281,17 @@ def debates():
             did = p.get("id")
             if not did:
                 return jsonify({"error": "Missing id"}), 400
-            found = False
-            debates_list = data.get("debates", [])
-            for i, db in enumerate(debates_list):
-                if str(db.get("id")) == str(did):
-                    # update fields
-                    for k, v in p.items():
-                        if k == "id":
-                            continue
-                        debates_list[i][k] = v
-                    _ensure_live_shape(debates_list[i])
-                    # regen flow QRs (in case new steps were added)
-                    _gen_step_qrs_for_debate(debates_list[i])
-                    found = True
-                    break
-            if not found:
+            db = _debate_by_id(data, did)
+            if not db:
                 return jsonify({"error": "Debate not found"}), 404
-            data["debates"] = debates_list
+            # update fields
+            for k, v in p.items():
+                if k == "id":
+                    continue
+                db[k] = v
+            _ensure_live_shape(db)
+            # regen flow QRs (in case new steps were added)
+            _gen_step_qrs_for_debate(db)
             save_data(data)
             return jsonify({"status": "updated"}), 200
 
@@ -786,18 +1301,20 @@ def debates():
                 return jsonify({"error": "Missing id"}), 400
             
             # Remove associated points entries for this debate
-            points_entries = data.get("points_entries", [])
+            points_entries = data["points_entries"]
             data["points_entries"] = [entry for entry in points_entries if entry.get("debate_id") != int(did)]
             
             # Remove the debate
             data["debates"] = [x for x in data.get("debates", []) if str(x.get("id")) != str(did)]
             save_data(data)
+            _RUBRIC_BY_ROUND.pop(str(did), None)
+            _TEAMS_VIEW.pop(str(did), None)
             return jsonify({"status": "deleted"}), 200
 
         # GET – list
-        return jsonify(data.get("debates", []))
+        return _cached_json(("debates",), lambda: data.get("debates", []))
     except Exception as e:
-        print("ERROR /api/debates:", e)
+        log.exception("/api/debates")
         return jsonify({"error": str(e)}), 500
 
 # GET un singur debate (util pentru live.html)
@@ -805,13 +1322,13 @@ def debates():
 def get_debate(did):
     try:
         data = load_data()
-        d = next((x for x in data.get("debates", []) if str(x.get("id")) == str(did)), None)
+        d = _debate_by_id(data, did)
         if not d:
             return jsonify({"error": "Debate not found"}), 404
         _ensure_live_shape(d)
         return jsonify(d)
     except Exception as e:
-        print("ERROR /api/debates/<did>:", e)
+        log.exception("/api/debates/<did>")
         return jsonify({"error": str(e)}), 500
 
 # ---------- Registration (QR + page + listare) ----------
@@ -819,48 +1336,19 @@ def get_debate(did):
 def debate_registration_qr(did):
     try:
         data = load_data()
-        debate = next((d for d in data.get("debates", []) if str(d.get("id")) == str(did)), None)
+        debate = _debate_by_id(data, did)
         if not debate:
             return jsonify({"error": "Debate not found"}), 404
         reg_url = url_for("debate_register_page", did=did, _external=True)
         qr_url, ts = _versioned_qr_png(reg_url, f"qr_reg_{did}")
         debate["registration_qr"] = {"url": reg_url, "qr_url": qr_url, "ts": ts}
-        for i, d in enumerate(data["debates"]):
-            if str(d.get("id")) == str(did):
-                data["debates"][i] = debate
-                break
         save_data(data)
         return jsonify({"qr_url": qr_url, "reg_url": reg_url, "ts": ts, "form_url": reg_url})
     except Exception as e:
-        print("ERROR /api/debates/<did>/registration-qr:", e)
+        log.exception("/api/debates/<did>/registration-qr")
         return jsonify({"error": str(e)}), 500
 
-@app.route("/debates/<did>/register", methods=["GET", "POST"])
-def debate_register_page(did):
-    try:
-        data = load_data()
-        debate = next((d for d in data.get("debates", []) if str(d.get("id")) == str(did)), None)
-        if not debate:
-            return make_response("Debate not found", 404)
-
-        message = ""
-        if request.method == "POST":
-            email = (request.form.get("email") or "").strip().lower()
-            choice = (request.form.get("choice") or "none").strip().lower()
-            if not email:
-                message = "Please enter a valid email."
-            else:
-                signups = debate.get("signups") or {}
-                signups[email] = {"choice": choice, "ts": int(time.time())}
-                debate["signups"] = signups
-                for i, d in enumerate(data["debates"]):
-                    if str(d.get("id")) == str(did):
-                        data["debates"][i] = debate
-                        break
-                save_data(data)
-                message = "Registration recorded. Thank you!"
-
-        html = render_template_string("""
+_REGISTER_TMPL = app.jinja_env.from_string("""
         <!DOCTYPE html><html><head>
         <meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1" />
         <title>Debate registration</title>
@@ -892,22 +1380,43 @@ def debate_register_page(did):
             </form>
           </div>
         </body></html>
-        """, aff=(debate.get("affirmation") or "Debate"), message=message)
+        """)  # compiled once at import
+
+@app.route("/debates/<did>/register", methods=["GET", "POST"])
+def debate_register_page(did):
+    try:
+        data = load_data()
+        debate = _debate_by_id(data, did)
+        if not debate:
+            return make_response("Debate not found", 404)
+
+        message = ""
+        if request.method == "POST":
+            email = (request.form.get("email") or "").strip().lower()
+            choice = (request.form.get("choice") or "none").strip().lower()
+            if not email:
+                message = "Please enter a valid email."
+            else:
+                _subdict(debate, "signups")[email] = {"choice": choice, "ts": int(time.time())}
+                save_data(data)
+                message = "Registration recorded. Thank you!"
+
+        html = render_template(_REGISTER_TMPL, aff=(debate.get("affirmation") or "Debate"), message=message)
         return html
-    except Exception as e:
-        print("ERROR /debates/<did>/register:", e)
+    except Exception:
+        log.exception("/debates/<did>/register")
         return make_response("Error", 500)
 
 @app.route("/api/debates/<did>/signups", methods=["GET"])
 def debate_signups(did):
     try:
         data = load_data()
-        debate = next((d for d in data.get("debates", []) if str(d.get("id")) == str(did)), None)
+        debate = _debate_by_id(data, did)
         if not debate:
             return jsonify({"error": "Debate not found"}), 404
         return jsonify(debate.get("signups") or {})
     except Exception as e:
-        print("ERROR /api/debates/<did>/signups:", e)
+        log.exception("/api/debates/<did>/signups")
         return jsonify({"error": str(e)}), 500
 
 # ---------- Randomize (teams/judges) ----------
@@ -916,28 +1425,20 @@ def debate_randomize(did):
     import random
     try:
         data = load_data()
-        debates = data.get("debates", [])
-        debate = next((d for d in debates if str(d.get("id")) == str(did)), None)
+        debate = _debate_by_id(data, did)
         if not debate:
             return jsonify({"error": "Debate not found"}), 404
 
-        def _pmail(s): return (s or "").strip().lower()
-
-        def _participations_count(email: str) -> int:
-            em = _pmail(email)
-            cnt = 0
-            for d in data.get("debates", []):
-                if any(_pmail(x) == em for x in d.get("judges", []) or []):
-                    cnt += 1
-                for t in d.get("teams", []) or []:
-                    if any(_pmail(x) == em for x in t.get("members", []) or []):
-                        cnt += 1
-                if any(_pmail(x) == em for x in d.get("reserves", []) or []):
-                    cnt += 1
-            return cnt
+        # participations per email across all debates (judge, each team, reserve), counted once up front
+        counts = Counter()
+        for d in data.get("debates", []):
+            counts.update({_norm_email(x) for x in d.get("judges", []) or []})
+            for t in d.get("teams", []) or []:
+                counts.update({_norm_email(x) for x in t.get("members", []) or []})
+            counts.update({_norm_email(x) for x in d.get("reserves", []) or []})
 
         def sort_key(email: str):
-            return (_participations_count(email), random.random())
+            return (counts.get(_norm_email(email), 0), random.random())
 
         fmt = debate.get("format") or {"team_count": 2, "team_size": 2, "judge_count": 2}
         team_count = int(fmt.get("team_count", 2))
@@ -946,24 +1447,24 @@ def debate_randomize(did):
         total_slots = team_count * team_size
 
         signups = debate.get("signups") or {}
-        def eligible(e): return _member_by_email(data, e) is not None
-
-        # Separate pools based on signup choices
-        judges_only = [e for e, info in signups.items()
-                      if info.get("choice") == "judge" and eligible(e)]
-        advocates_only = [e for e, info in signups.items()
-                         if info.get("choice") == "advocate" and eligible(e)]
-        any_role = [e for e, info in signups.items()
-                   if info.get("choice") == "any" and eligible(e)]
+        # one members lookup per signup, reused by every pool/studio split below
+        studio = {e: _studio_of(data, e) for e in signups}
+        eligible_set = {e for e in signups if _member_by_email(data, e) is not None}
+
+        # Separate pools based on signup choices (one pass; "none" and unknown choices are skipped)
+        judges_only, advocates_only, any_role = [], [], []
+        pools = {"judge": judges_only, "advocate": advocates_only, "any": any_role}
+        for e, info in signups.items():
+            pool = pools.get(info.get("choice"))
+            if pool is not None and e in eligible_set:
+                pool.append(e)
         
         # Create separate pools respecting participant choices
         # Judges can be: judges_only + any_role
-        judges_pool = judges_only + any_role
-        judges_pool = list(dict.fromkeys(judges_pool))  # remove duplicates
+        judges_pool = list(set(judges_only) | set(any_role))  # deduped; order doesn't matter, it's shuffled below
         
         # Advocates can be: advocates_only + any_role  
-        advocates_pool = advocates_only + any_role
-        advocates_pool = list(dict.fromkeys(advocates_pool))  # remove duplicates
+        advocates_pool = list(set(advocates_only) | set(any_role))
         
         # Sort by participation count (fewer participations = higher priority)
         judges_pool.sort(key=sort_key)
@@ -975,8 +1476,7 @@ def debate_randomize(did):
 
         # Check if we have enough members for both judges and teams
         # We need to ensure that after selecting judges, we still have enough advocates for teams
-        all_eligible = judges_only + advocates_only + any_role
-        all_eligible = list(dict.fromkeys(all_eligible))  # remove duplicates
+        all_eligible = set(judges_only) | set(advocates_only) | set(any_role)
         
         if len(all_eligible) < total_slots + judge_count:
             return jsonify({"error": f"Insufficient members registered (need {total_slots + judge_count}, we have {len(all_eligible)})"}), 400
@@ -994,9 +1494,9 @@ def debate_randomize(did):
             return jsonify({"error": f"Insufficient judges registered (min {judge_count}, we have {len(judges_pool)})"}), 400
 
         # Select judges with balanced CC/WSOP distribution
-        cc_judges = [e for e in judges_pool if _studio_of(data, e) == "CC"]
-        ws_judges = [e for e in judges_pool if _studio_of(data, e) == "WSOP"]
-        ot_judges = [e for e in judges_pool if _studio_of(data, e) not in ("CC","WSOP")]
+        cc_judges = [e for e in judges_pool if studio.get(e) == "CC"]
+        ws_judges = [e for e in judges_pool if studio.get(e) == "WSOP"]
+        ot_judges = [e for e in judges_pool if studio.get(e) not in ("CC","WSOP")]
         
         # Randomize each studio's judges
         random.shuffle(cc_judges)
@@ -1008,9 +1508,10 @@ def debate_randomize(did):
         picked_judges = []
         
         # First, try to select from judges_only to minimize impact on advocates_pool
-        cc_judges_only = [e for e in cc_judges if e in judges_only]
-        ws_judges_only = [e for e in ws_judges if e in judges_only]
-        ot_judges_only = [e for e in ot_judges if e in judges_only]
+        judges_only_set = set(judges_only)
+        cc_judges_only = [e for e in cc_judges if e in judges_only_set]
+        ws_judges_only = [e for e in ws_judges if e in judges_only_set]
+        ot_judges_only = [e for e in ot_judges if e in judges_only_set]
         
         # Select from judges_only first
         cc_judges_only_count = min(len(cc_judges_only), judge_count // 2)
@@ -1020,13 +1521,14 @@ def debate_randomize(did):
         picked_judges.extend(cc_judges_only[:cc_judges_only_count])
         picked_judges.extend(ws_judges_only[:ws_judges_only_count])
         picked_judges.extend(ot_judges_only[:ot_judges_only_count])
+        picked_set = set(picked_judges)
         
         # If we still need more judges, fill from any_role
         remaining_judges_needed = judge_count - len(picked_judges)
         if remaining_judges_needed > 0:
-            cc_any_remaining = [e for e in cc_judges if e not in picked_judges]
-            ws_any_remaining = [e for e in ws_judges if e not in picked_judges]
-            ot_any_remaining = [e for e in ot_judges if e not in picked_judges]
+            cc_any_remaining = [e for e in cc_judges if e not in picked_set]
+            ws_any_remaining = [e for e in ws_judges if e not in picked_set]
+            ot_any_remaining = [e for e in ot_judges if e not in picked_set]
             
             # Fill remaining slots from any_role
             cc_any_count = min(len(cc_any_remaining), remaining_judges_needed // 2)
@@ -1036,65 +1538,61 @@ def debate_randomize(did):
             picked_judges.extend(cc_any_remaining[:cc_any_count])
             picked_judges.extend(ws_any_remaining[:ws_any_count])
             picked_judges.extend(ot_any_remaining[:ot_any_count])
+            picked_set.update(picked_judges)
         
         # Remove selected judges from advocates pool to avoid conflicts
-        remaining_advocates = [e for e in advocates_pool if e not in picked_judges]
+        remaining_advocates = [e for e in advocates_pool if e not in picked_set]
 
-        # Debug: print available members
-        print(f"DEBUG: Total advocates pool: {len(advocates_pool)}")
-        print(f"DEBUG: Selected judges: {len(picked_judges)}")
-        print(f"DEBUG: Remaining advocates: {len(remaining_advocates)}")
-        print(f"DEBUG: Need {total_slots} team members for {team_count} teams of {team_size}")
+        # Debug: available members (checked once; the fill loop below is per member)
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug("Total advocates pool: %d", len(advocates_pool))
+            log.debug("Selected judges: %d", len(picked_judges))
+            log.debug("Remaining advocates: %d", len(remaining_advocates))
+            log.debug("Need %d team members for %d teams of %d", total_slots, team_count, team_size)
 
         # Initialize teams
-        teams = (debate.get("teams") or [])[:team_count]
-        while len(teams) < team_count:
-            idx = len(teams) + 1
-            teams.append({"id": f"t{idx}", "name": f"Team {idx}", "members": []})
-        for t in teams:
-            t["members"] = []
+        # copies: load_data() is shared, so don't touch the stored teams before validation passes
+        existing = debate.get("teams") or []
+        teams = [{**existing[i], "members": []} if i < len(existing)
+                 else {"id": f"t{i + 1}", "name": f"Team {i + 1}", "members": []}
+                 for i in range(team_count)]
 
         # Distribute remaining advocates to teams with balanced CC/WSOP
-        cc_remaining = [e for e in remaining_advocates if _studio_of(data, e) == "CC"]
-        ws_remaining = [e for e in remaining_advocates if _studio_of(data, e) == "WSOP"]
-        ot_remaining = [e for e in remaining_advocates if _studio_of(data, e) not in ("CC","WSOP")]
+        cc_remaining = [e for e in remaining_advocates if studio.get(e) == "CC"]
+        ws_remaining = [e for e in remaining_advocates if studio.get(e) == "WSOP"]
+        ot_remaining = [e for e in remaining_advocates if studio.get(e) not in ("CC","WSOP")]
         
         # Randomize each studio's remaining members
         random.shuffle(cc_remaining)
         random.shuffle(ws_remaining)
         random.shuffle(ot_remaining)
         
-        # Distribute members round-robin to balance teams
         used = set()
-        order = list(range(team_count))
-        random.shuffle(order)
-        
-        def team_counts(t):
-            c = sum(1 for e in t["members"] if _studio_of(data, e) == "CC")
-            w = sum(1 for e in t["members"] if _studio_of(data, e) == "WSOP")
-            return c, w
 
         # Simple approach: fill teams one by one with remaining advocates
         all_remaining = cc_remaining + ws_remaining + ot_remaining
         random.shuffle(all_remaining)
+        all_remaining = deque(all_remaining)  # popleft() is O(1), list.pop(0) shifts the whole list
         
-        # Debug: print available members
-        print(f"DEBUG: Available members for teams: {len(all_remaining)}")
-        print(f"DEBUG: Need {total_slots} members for {team_count} teams of {team_size}")
+        # Debug: available members
+        if debug:
+            log.debug("Available members for teams: %d", len(all_remaining))
+            log.debug("Need %d members for %d teams of %d", total_slots, team_count, team_size)
         
         # Fill each team to team_size
         for t in teams:
             while len(t["members"]) < team_size and all_remaining:
-                p = all_remaining.pop(0)
+                p = all_remaining.popleft()
                 if p not in used:
                     t["members"].append(p)
                     used.add(p)
-                    print(f"DEBUG: Added {p} to team {t['name']} (now {len(t['members'])}/{team_size})")
+                    if debug:
+                        log.debug("Added %s to team %s (now %d/%d)", p, t['name'], len(t['members']), team_size)
         
-        # Debug: print final team sizes
-        print(f"DEBUG: Final team sizes:")
-        for i, t in enumerate(teams):
-            print(f"  Team {i+1}: {len(t['members'])} members")
+        # Debug: final team sizes
+        if debug:
+            log.debug("Final team sizes: %s", ", ".join(f"Team {i+1}: {len(t['members'])}" for i, t in enumerate(teams)))
 
         # Verify that all teams have exactly team_size members
         for t in teams:
@@ -1104,7 +1602,7 @@ def debate_randomize(did):
         # Calculate reserves from all available members (excluding judges and team members)
         # Reserves don't need to respect studio distribution - just randomize completely
         all_available = judges_only + advocates_only + any_role
-        all_used = set(picked_judges) | used
+        all_used = picked_set | used
         reserves = [e for e in all_available if e not in all_used]
         # Randomize reserves order completely - studio distribution doesn't matter
         random.shuffle(reserves)
@@ -1113,81 +1611,15 @@ def debate_randomize(did):
         debate["teams"] = teams
         debate["reserves"] = reserves
 
-        for i, d in enumerate(debates):
-            if str(d.get("id")) == str(did):
-                debates[i] = debate
-                break
-        data["debates"] = debates
         save_data(data)
 
         return jsonify({"ok": True, "judges": picked_judges, "teams": teams, "reserves": reserves})
     except Exception as e:
-        print("ERROR /api/debates/<did>/randomize:", e)
+        log.exception("/api/debates/<did>/randomize")
         return jsonify({"error": str(e)}), 500
 
 # ---------- Vot PUBLIC (per pas) ----------
-@app.route("/debates/<did>/vote", methods=["GET", "POST"])
-def public_vote_page(did):
-    try:
-        data = load_data()
-        debate = next((d for d in data.get("debates", []) if str(d.get("id")) == str(did)), None)
-        if not debate:
-            return make_response("Debate not found", 404)
-
-        step = int(request.values.get("step", "0"))
-        flow = debate.get("flow") or []
-        if step < 0 or step >= len(flow):
-            return make_response("Invalid step", 400)
-        action = (flow[step].get("action") or "none")
-        if action not in ("public_vote", "jury+public", "simple_jury+public"):
-            return make_response("Not a public vote step", 400)
-
-        # meeting invite validation
-        meeting = next((m for m in (load_data().get("meetings") or []) if str(m.get("id")) == str(debate.get("meeting_id"))), None)
-        invited = _participants_by_email_map(meeting) if meeting else {}
-
-        message = ""
-        if request.method == "POST":
-            email = (request.form.get("email") or "").strip().lower()
-            team_id = (request.form.get("team_id") or "").strip()
-            if not email or not team_id:
-                message = "Please fill in email + team choice."
-            else:
-                # email must be invited to meeting (not necessarily check-in)
-                if email not in invited:
-                    message = "Email is not invited to this meeting."
-                else:
-                    # don't allow judge or team member to vote as public
-                    if email in (debate.get("judges") or []):
-                        message = "Jury members cannot vote as public."
-                    elif any(email in (t.get("members") or []) for t in (debate.get("teams") or [])):
-                        message = "Team members cannot vote as public."
-                    else:
-                        scores = debate.get("scores") or {}
-                        pub = (scores.get("public") or {})
-                        step_map = pub.get(str(step)) or {}
-                        voters = step_map.get("_voters") or {}
-                        prev = voters.get(email)
-                        if prev:
-                            if prev != team_id:
-                                step_map[prev] = max(0, int(step_map.get(prev, 1)) - 1)
-                        voters[email] = team_id
-                        step_map["_voters"] = voters
-                        step_map[team_id] = int(step_map.get(team_id, 0)) + 1
-                        pub[str(step)] = step_map
-                        scores["public"] = pub
-                        debate["scores"] = scores
-                        # persist
-                        for i, d in enumerate(data["debates"]):
-                            if str(d.get("id")) == str(did):
-                                data["debates"][i] = debate
-                                break
-                        save_data(data)
-                        message = "Vote recorded. Thank you!"
-
-        teams = debate.get("teams", [])
-        step_title = flow[step].get("title") or f"Step {step+1}"
-        html = render_template_string("""
+_PUBLIC_VOTE_TMPL = app.jinja_env.from_string("""
         <!DOCTYPE html><html><head><meta charset="utf-8">
         <meta name="viewport" content="width=device-width, initial-scale=1" />
         <title>Public vote</title>
@@ -1215,101 +1647,72 @@ def public_vote_page(did):
             </form>
           </div>
         </body></html>
-        """, aff=(debate.get("affirmation") or "Debate"), teams=teams, message=message, step_title=step_title)
-        return html
-    except Exception as e:
-        print("ERROR /debates/<did>/vote:", e)
-        return make_response("Error", 500)
+        """)  # compiled once at import
 
-# ---------- JURY Vote (per step, on rubric) ----------
-@app.route("/debates/<did>/jury", methods=["GET", "POST"])
-def jury_vote_page(did):
+@app.route("/debates/<did>/vote", methods=["GET", "POST"])
+def public_vote_page(did):
     try:
         data = load_data()
-        debate = next((d for d in data.get("debates", []) if str(d.get("id")) == str(did)), None)
+        debate = _debate_by_id(data, did)
         if not debate:
             return make_response("Debate not found", 404)
 
         step = int(request.values.get("step", "0"))
+        step_key = str(step)  # scores are keyed by the step number as a string
         flow = debate.get("flow") or []
         if step < 0 or step >= len(flow):
             return make_response("Invalid step", 400)
         action = (flow[step].get("action") or "none")
-        if action not in ("jury_vote", "jury+public", "simple_jury_vote", "simple_jury+public"):
-            return make_response("Not a jury vote step", 400)
+        if action not in ("public_vote", "jury+public", "simple_jury+public"):
+            return make_response("Not a public vote step", 400)
 
-        teams = debate.get("teams") or []
-        all_rubric = debate.get("rubric") or []
-        
-        # Filter rubric based on current step's round
-        current_step = flow[step]
-        current_round = current_step.get("round", "1")
-        
-        # Get general criteria + criteria for current round
-        rubric = []
-        for c in all_rubric:
-            c_type = c.get("type", "general")
-            c_round = c.get("round", "1")
-            if c_type == "general" or (c_type == "round" and c_round == current_round):
-                rubric.append(c)
-        
-        # Check if this is simple jury vote (no rubric needed) or complex vote
-        is_simple_vote = action in ("simple_jury_vote", "simple_jury+public")
-        has_rubric = not is_simple_vote and any(c.get("min") is not None and c.get("max") is not None for c in rubric)
+        # meeting invite validation
+        meeting = _meeting_by_id(data, debate.get("meeting_id"))
+        invited = _participants_by_email_map(meeting) if meeting else {}
 
         message = ""
         if request.method == "POST":
             email = (request.form.get("email") or "").strip().lower()
-            # validation: email must be in jury
-            if email not in (debate.get("judges") or []):
-                message = "Email is not in the jury for this debate."
+            team_id = (request.form.get("team_id") or "").strip()
+            if not email or not team_id:
+                message = "Please fill in email + team choice."
             else:
-                # read scores
-                scores = debate.get("scores") or {}
-                jury = (scores.get("jury") or {})
-                step_map = jury.get(str(step)) or {}
-                judge_map = {}
-                
-                if has_rubric:
-                    # Complex rubric scoring - parse inputs: name="{team_id}__{crit_key}"
-                    for t in teams:
-                        t_id = t.get("id")
-                        for c in rubric:
-                            key = c.get("key")
-                            field = f"{t_id}__{key}"
-                            raw = request.form.get(field, "")
-                            if raw == "":
-                                continue
-                            try:
-                                val = float(raw)
-                            except:
-                                continue
-                            # clamp between min/max
-                            minv = float(c.get("min", 0))
-                            maxv = float(c.get("max", 10))
-                            val = max(minv, min(maxv, val))
-                            judge_map.setdefault(t_id, {})[key] = val
+                # email must be invited to meeting (not necessarily check-in)
+                if email not in invited:
+                    message = "Email is not invited to this meeting."
                 else:
-                    # Simple team choice - give 1 point to selected team
-                    team_choice = request.form.get("team_choice", "")
-                    if team_choice in [t.get("id") for t in teams]:
-                        judge_map[team_choice] = {"default": 1.0}
-                
-                # save for this judge
-                step_map[email] = judge_map
-                jury[str(step)] = step_map
-                scores["jury"] = jury
-                debate["scores"] = scores
-                # persist
-                for i, d in enumerate(data["debates"]):
-                    if str(d.get("id")) == str(did):
-                        data["debates"][i] = debate
-                        break
-                save_data(data)
-                message = "Vote recorded. Thank you!"
+                    # don't allow judge or team member to vote as public
+                    judges_set = set(debate.get("judges") or [])
+                    team_members_set = {m for t in (debate.get("teams") or []) for m in (t.get("members") or [])}
+                    if email in judges_set:
+                        message = "Jury members cannot vote as public."
+                    elif email in team_members_set:
+                        message = "Team members cannot vote as public."
+                    else:
+                        with _entity_lock("debate", did):  # two voters on the same step must not drop each other's vote
+                            # scores.public[step] is created in place if missing
+                            step_map = _subdict(_subdict(_subdict(debate, "scores"), "public"), step_key)
+                            voters = _subdict(step_map, "_voters")
+                            prev = voters.get(email)
+                            if prev:
+                                if prev != team_id:
+                                    step_map[prev] = max(0, int(step_map.get(prev, 1)) - 1)
+                            voters[email] = team_id
+                            step_map[team_id] = int(step_map.get(team_id, 0)) + 1
+                            # persist
+                            save_data(data, durable=True)
+                        message = "Vote recorded. Thank you!"
 
+        teams = debate.get("teams", [])
         step_title = flow[step].get("title") or f"Step {step+1}"
-        html = render_template_string("""
+        html = render_template(_PUBLIC_VOTE_TMPL, aff=(debate.get("affirmation") or "Debate"), teams=teams, message=message, step_title=step_title)
+        return html
+    except Exception:
+        log.exception("/debates/<did>/vote")
+        return make_response("Error", 500)
+
+# ---------- JURY Vote (per step, on rubric) ----------
+_JURY_VOTE_TMPL = app.jinja_env.from_string("""
         <!DOCTYPE html><html><head><meta charset="utf-8">
         <meta name="viewport" content="width=device-width, initial-scale=1" />
         <title>Jury vote</title>
@@ -1391,68 +1794,181 @@ def jury_vote_page(did):
             }
           </script>
         </body></html>
-        """, aff=(debate.get("affirmation") or "Debate"),
+        """)  # compiled once at import
+
+@app.route("/debates/<did>/jury", methods=["GET", "POST"])
+def jury_vote_page(did):
+    try:
+        data = load_data()
+        debate = _debate_by_id(data, did)
+        if not debate:
+            return make_response("Debate not found", 404)
+
+        step = int(request.values.get("step", "0"))
+        step_key = str(step)  # scores are keyed by the step number as a string
+        flow = debate.get("flow") or []
+        if step < 0 or step >= len(flow):
+            return make_response("Invalid step", 400)
+        action = (flow[step].get("action") or "none")
+        if action not in ("jury_vote", "jury+public", "simple_jury_vote", "simple_jury+public"):
+            return make_response("Not a jury vote step", 400)
+
+        teams = debate.get("teams") or []
+
+        # General criteria + criteria for the current step's round
+        current_step = flow[step]
+        current_round = current_step.get("round", "1")
+        rubric = _rubric_for_round(debate, current_round)
+        
+        # Check if this is simple jury vote (no rubric needed) or complex vote
+        is_simple_vote = action in ("simple_jury_vote", "simple_jury+public")
+        has_rubric = not is_simple_vote and any(c.get("min") is not None and c.get("max") is not None for c in rubric)
+
+        message = ""
+        if request.method == "POST":
+            email = (request.form.get("email") or "").strip().lower()
+            # validation: email must be in jury
+            if email not in (debate.get("judges") or []):
+                message = "Email is not in the jury for this debate."
+            else:
+                judge_map = {}
+                
+                if has_rubric:
+                    # Complex rubric scoring - parse inputs: name="{team_id}__{crit_key}"
+                    # (key, min, max) per criterion, converted once instead of per team;
+                    # criteria without numeric bounds can't be scored and are skipped
+                    numeric_criteria = []
+                    for c in rubric:
+                        minv, maxv = _score_value(c.get("min", 0)), _score_value(c.get("max", 10))
+                        if minv is not None and maxv is not None:
+                            numeric_criteria.append((c.get("key"), minv, maxv))
+                    for t in teams:
+                        t_id = t.get("id")
+                        for key, minv, maxv in numeric_criteria:
+                            field = f"{t_id}__{key}"
+                            raw = request.form.get(field, "")
+                            if raw == "":
+                                continue
+                            try:
+                                val = float(raw)
+                            except:
+                                continue
+                            # clamp between min/max
+                            val = max(minv, min(maxv, val))
+                            judge_map.setdefault(t_id, {})[key] = val
+                else:
+                    # Simple team choice - give 1 point to selected team
+                    team_choice = request.form.get("team_choice", "")
+                    if team_choice in [t.get("id") for t in teams]:
+                        judge_map[team_choice] = {"default": 1.0}
+                
+                with _entity_lock("debate", did):  # two judges on the same step must not drop each other's scores
+                    # save for this judge (scores.jury[step] is created in place if missing)
+                    _subdict(_subdict(_subdict(debate, "scores"), "jury"), step_key)[email] = judge_map
+                    # persist
+                    save_data(data, durable=True)
+                message = "Vote recorded. Thank you!"
+
+        step_title = flow[step].get("title") or f"Step {step+1}"
+        # the template uses no Flask globals, so skip render_template()'s context processors
+        html = _JURY_VOTE_TMPL.render(aff=(debate.get("affirmation") or "Debate"),
              teams=teams, rubric=rubric, message=message, step_title=step_title, has_rubric=has_rubric, is_simple_vote=is_simple_vote)
         return html
-    except Exception as e:
-        print("ERROR /debates/<did>/jury:", e)
+    except Exception:
+        log.exception("/debates/<did>/jury")
         return make_response("Error", 500)
 
+_TEAMS_VIEW = {}  # debate id -> (teams list, its len at build time, [{"id", "name"}])
+
+def _teams_view(debate):
+    """The {id, name} team list sent to live pages; rebuilt only when the debate's teams list changes."""
+    teams = debate.get("teams") or []
+    key = str(debate.get("id"))
+    cached = _TEAMS_VIEW.get(key)
+    if not cached or cached[0] is not teams or cached[1] != len(teams):
+        cached = (teams, len(teams), [{"id": t["id"], "name": t.get("name") or t["id"]} for t in teams])
+        _TEAMS_VIEW[key] = cached
+    return cached[2]
+
+RESPONSE_CACHE_MAX = 256  # keys include client-supplied ids (?meeting_id=...), so keep it bounded
+
+def _evict_responses():
+    """Make room in _RESPONSE_CACHE: drop bodies built before the last save, else the oldest insert."""
+    with _DATA_LOCK:
+        for k in [k for k, v in list(_RESPONSE_CACHE.items()) if v[0][0] != _SAVE_GEN]:
+            del _RESPONSE_CACHE[k]
+        while len(_RESPONSE_CACHE) >= RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)), None)
+
+def _cached_json(key, build, stamp=None):
+    """JSON response for a read-only endpoint; build() only runs again after a save_data()
+    (or when stamp differs from the one the cached body was built with).
+
+    Carries an ETag of the body, so a poll with a matching If-None-Match gets an empty 304.
+    """
+    gen = (_SAVE_GEN, stamp)
+    hit = _RESPONSE_CACHE.get(key)
+    if hit is None or hit[0] != gen:
+        body = jsonify(build()).get_data()
+        if hit is None and len(_RESPONSE_CACHE) >= RESPONSE_CACHE_MAX:
+            _evict_responses()
+        hit = _RESPONSE_CACHE[key] = (gen, body, hashlib.blake2b(body, digest_size=12).hexdigest())
+    resp = app.response_class(hit[1], mimetype="application/json")
+    resp.set_etag(hit[2])
+    return resp.make_conditional(request)
+
 # ---------- Live state & scor live ----------
+# One worker: two debates stopping together must not race on points_entries.
+_AWARD_EXEC = ThreadPoolExecutor(max_workers=1, thread_name_prefix="awards")
+
 @app.route("/api/debates/<did>/live/start", methods=["POST"])
 def live_start(did):
     try:
         data = load_data()
-        debates = data.get("debates", [])
-        for i, d in enumerate(debates):
-            if str(d.get("id")) == str(did):
-                _ensure_live_shape(d)
-                d["live"]["active"] = True
-                d["live"]["started_at"] = int(time.time())
-                d["status"] = "live"
-                debates[i] = d
-                data["debates"] = debates
-                save_data(data)
-                return jsonify({"ok": True, "live": d["live"]})
-        return jsonify({"error": "Debate not found"}), 404
+        d = _debate_by_id(data, did)
+        if not d:
+            return jsonify({"error": "Debate not found"}), 404
+        _ensure_live_shape(d)
+        d["live"]["active"] = True
+        d["live"]["started_at"] = int(time.time())
+        d["status"] = "live"
+        save_data(data, durable=True)
+        return jsonify({"ok": True, "live": d["live"]})
     except Exception as e:
-        print("ERROR /api/debates/<did>/live/start:", e)
+        log.exception("/api/debates/<did>/live/start")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/debates/<did>/live/stop", methods=["POST"])
 def live_stop(did):
     try:
         data = load_data()
-        debates = data.get("debates", [])
-        for i, d in enumerate(debates):
-            if str(d.get("id")) == str(did):
-                _ensure_live_shape(d)
-                d["live"]["active"] = False
-                d["status"] = "finished"
-                debates[i] = d
-                data["debates"] = debates
-                save_data(data)
-                
-                # Award debate points
-                award_debate_points(d)
-                
-                return jsonify({"ok": True, "live": d["live"]})
-        return jsonify({"error": "Debate not found"}), 404
+        d = _debate_by_id(data, did)
+        if not d:
+            return jsonify({"error": "Debate not found"}), 404
+        _ensure_live_shape(d)
+        d["live"]["active"] = False
+        d["status"] = "finished"
+        save_data(data, durable=True)
+
+        # Award debate points in the background; the response does not depend on them
+        _AWARD_EXEC.submit(award_debate_points, copy.deepcopy(d))
+
+        return jsonify({"ok": True, "live": d["live"]})
     except Exception as e:
-        print("ERROR /api/debates/<did>/live/stop:", e)
+        log.exception("/api/debates/<did>/live/stop")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/debates/<did>/live", methods=["GET"])
 def live_state(did):
     try:
         data = load_data()
-        d = next((x for x in data.get("debates", []) if str(x.get("id")) == str(did)), None)
+        d = _debate_by_id(data, did)
         if not d:
             return jsonify({"error": "Debate not found"}), 404
         _ensure_live_shape(d)
-        return jsonify(d.get("live"))
+        return _cached_json(("live", str(did)), lambda: d.get("live"))
     except Exception as e:
-        print("ERROR /api/debates/<did>/live:", e)
+        log.exception("/api/debates/<did>/live")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/debates/<did>/scores", methods=["GET"])
@@ -1463,67 +1979,40 @@ def live_scores(did):
     """
     try:
         data = load_data()
-        d = next((x for x in data.get("debates", []) if str(x.get("id")) == str(did)), None)
+        d = _debate_by_id(data, did)
         if not d:
             return jsonify({"error": "Debate not found"}), 404
-        _ensure_live_shape(d)
-        active = bool(d.get("live", {}).get("active"))
-        resp = {
-            "active": active,
-            "updated_at": d.get("created_at"),
-            "teams": [{"id": t["id"], "name": t.get("name") or t["id"]} for t in (d.get("teams") or [])],
-            "totals": _compute_totals(d) if active else {},
-            "scores": d.get("scores") if active else {},
-        }
-        return jsonify(resp)
+        # no _ensure_live_shape() here: a missing/odd "live" just means inactive
+        live = d.get("live")
+        active = isinstance(live, dict) and bool(live.get("active"))
+
+        def build():
+            return {
+                "active": active,
+                "updated_at": d.get("created_at"),
+                "teams": _teams_view(d),
+                "totals": _compute_totals(d) if active else {},
+                "scores": d.get("scores") if active else {},
+            }
+        return _cached_json(("scores", str(did)), build)
     except Exception as e:
-        print("ERROR /api/debates/<did>/scores:", e)
+        log.exception("/api/debates/<did>/scores")
         return jsonify({"error": str(e)}), 500
 
 # ---------- Simple timer (kept for compatibility / debug) ----------
 @app.route("/debates/<did>/timer")
 def debate_timer(did):
-    return """
-<!DOCTYPE html><html><head><meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1" />
-<title>Debate Timer</title>
-<style>
-  body{font-family:Arial,sans-serif;background:#0b1220;color:#fff;margin:0;padding:24px;text-align:center}
-  .big{font-size:96px;letter-spacing:2px;margin:20px 0}
-  .row{display:flex;gap:8px;justify-content:center;flex-wrap:wrap}
-  input,button{padding:10px;border-radius:10px;border:1px solid #2b3145;font-size:16px}
-  button{background:#1d2233;color:#fff;border:none;cursor:pointer}
-</style>
-</head><body>
-  <h1 style="margin:0">Debate Timer</h1>
-  <div id="title" style="opacity:.7">Round timer</div>
-  <div class="big" id="clock">00:00</div>
-  <div class="row">
-    <input id="min" type="number" placeholder="min" style="width:110px">
-    <input id="sec" type="number" placeholder="sec" style="width:110px">
-    <button id="btnStart">Start</button>
-    <button id="btnPause">Pause</button>
-    <button id="btnReset">Reset</button>
-  </div>
-  <script>
-    let total=0, left=0, tick=null, running=false;
-    const $=s=>document.querySelector(s);
-    function fmt(s){ return String(s).padStart(2,'0'); }
-    function draw(){ const m=Math.floor(left/60), s=left%60; $('#clock').textContent=fmt(m)+':'+fmt(s); }
-    function start(){
-      if(left<=0){ const m=+($('#min').value||0), s=+($('#sec').value||0); total=m*60+s; left=total; }
-      if(left<=0) return;
-      if(tick) clearInterval(tick);
-      running=true;
-      tick=setInterval(()=>{ left=Math.max(0,left-1); draw(); if(left<=0){ clearInterval(tick); running=false; tick=null; } },1000);
-      draw();
-    }
-    function pause(){ if(tick){ clearInterval(tick); tick=null; running=false; } }
-    function reset(){ pause(); left=0; total=0; draw(); }
-    $('#btnStart').onclick=start; $('#btnPause').onclick=pause; $('#btnReset').onclick=reset; draw();
-  </script>
-</body></html>
-"""
+    gz, etag = _static_page_gz("debate_timer.html")
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        resp = make_response(gz)
+        resp.headers["Content-Encoding"] = "gzip"
+        etag += "-gz"  # a different body than the identity response, so a different strong ETag
+    else:
+        resp = make_response(_static_page("debate_timer.html"))
+    resp.headers["Vary"] = "Accept-Encoding"
+    resp.headers["Cache-Control"] = "public, max-age=86400"
+    resp.set_etag(etag)
+    return resp.make_conditional(request)
 
 # ---------- Quiz CRUD ----------
 @app.route("/api/quizzes", methods=["GET", "POST", "PUT", "DELETE"])
@@ -1533,7 +2022,7 @@ def quizzes():
         if request.method == "POST":
             payload = request.json or {}
             q = {
-                "id": int(time.time() * 1000),
+                "id": _new_id(),
                 "meeting_id": payload.get("meeting_id"),
                 "title": payload.get("title", ""),
                 "status": payload.get("status", "draft"),
@@ -1549,12 +2038,12 @@ def quizzes():
             qid = payload.get("id")
             if not qid:
                 return jsonify({"error": "Missing id"}), 400
-            for idx, quiz in enumerate(data.get("quizzes", [])):
-                if str(quiz.get("id")) == str(qid):
-                    data["quizzes"][idx].update({k: v for k, v in payload.items() if k != "id"})
-                    save_data(data)
-                    return jsonify({"status": "updated"}), 200
-            return jsonify({"error": "Quiz not found"}), 404
+            quiz = _index(data, "quizzes_by_id").get(str(qid))
+            if quiz is None:
+                return jsonify({"error": "Quiz not found"}), 404
+            quiz.update({k: v for k, v in payload.items() if k != "id"})
+            save_data(data)
+            return jsonify({"status": "updated"}), 200
 
         if request.method == "DELETE":
             qid = request.args.get("id")
@@ -1567,10 +2056,10 @@ def quizzes():
             return jsonify({"status": "deleted"}), 200
 
         # GET
-        return jsonify(data.get("quizzes", []))
+        return _cached_json(("quizzes",), lambda: data.get("quizzes", []))
 
     except Exception as e:
-        print("ERROR /api/quizzes:", e)
+        log.exception("/api/quizzes")
         return jsonify({"error": str(e)}), 500
 
 # ---------- AI (KPI + newsletter HTML existent) ----------
@@ -1586,7 +2075,7 @@ def kpi_match():
         )
         return jsonify(result)
     except Exception as e:
-        print("ERROR /api/kpi-match:", e)
+        log.exception("/api/kpi-match")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/newsletter", methods=["POST"])
@@ -1596,25 +2085,37 @@ def newsletter():
         html = generate_newsletter_ai(payload)
         return jsonify({"html": html})
     except Exception as e:
-        print("ERROR /api/newsletter:", e)
+        log.exception("/api/newsletter")
         return jsonify({"error": str(e)}), 500
 
 # ---------- NOU: AI overlay copy (headline / subheadline / bullets) ----------
-from openai import OpenAI
-LM_BASE_URL = os.getenv("LM_BASE_URL", "http://127.0.0.1:80/v1")
 LM_MODEL_ID = os.getenv("LM_MODEL_ID", "meta-llama-3.1-8b-instruct-128k")
-LM_API_KEY  = os.getenv("OPENAI_API_KEY", "lm-studio")
-_llm = OpenAI(base_url=LM_BASE_URL, api_key=LM_API_KEY)
-
-def _extract_json_block(text: str) -> str:
-    import re
-    m = re.search(r"```json\s*(\{[\s\S]*?\})\s*```", text, re.IGNORECASE)
-    if m: return m.group(1).strip()
-    m = re.search(r"```\s*(\{[\s\S]*?\})\s*```", text, re.IGNORECASE)
-    if m: return m.group(1).strip()
-    i = text.find("{"); j = text.rfind("}")
-    if i != -1 and j != -1 and j > i: return text[i:j+1].strip()
-    raise ValueError("no JSON block")
+
+_LLM_EXEC = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm")
+KPI_MATCH_CHUNK = 10        # KPIs per match_kpis_with_ai prompt
+KPI_MATCH_TIMEOUT = 30      # seconds to wait for the slowest chunk (local model)
+OVERLAY_CACHE_TTL = 600     # seconds an overlay copy is reused for an identical request
+OVERLAY_CACHE_MAX = 128
+_OVERLAY_CACHE = {}         # blake2b of the request -> (expires_at, overlay)
+
+def _match_kpis_chunked(title, topic, agenda, all_kpis):
+    """match_kpis_with_ai over KPI_MATCH_CHUNK-sized slices of all_kpis, concurrently.
+
+    Returns (matched KPIs in catalogue order, True if any chunk failed or timed out).
+    """
+    futures = [_LLM_EXEC.submit(match_kpis_with_ai, title, topic, agenda, all_kpis[i:i + KPI_MATCH_CHUNK])
+               for i in range(0, len(all_kpis), KPI_MATCH_CHUNK)]
+    deadline = time.monotonic() + KPI_MATCH_TIMEOUT
+    matched, failed = [], False
+    for fut in futures:
+        try:
+            res = fut.result(timeout=max(0.0, deadline - time.monotonic()))
+        except TimeoutError:
+            failed = True
+            continue
+        failed = failed or "error" in res
+        matched.extend(res.get("matched_kpis") or [])
+    return matched, failed
 
 @app.route("/api/newsletter-overlay", methods=["POST"])
 def newsletter_overlay():
@@ -1630,56 +2131,26 @@ def newsletter_overlay():
         agenda = payload.get("agenda", []) or []
         provided_kpis = [str(x).strip() for x in (payload.get("kpis") or []) if str(x).strip()]
 
+        all_kpis = []
         if not provided_kpis:
             data = load_data()
             # Get all KPIs from all categories and flatten them
-            all_kpis = []
             categories = data.get("kpi_categories", [])
             for category in categories:
                 if category.get("kpis"):
                     for kpi in category["kpis"]:
                         all_kpis.append(f"{kpi.get('name', '')}: {kpi.get('how_to_measure', '')}")
+
+        # the KPI catalogue is part of the key: editing KPIs must not keep serving the old overlay
+        cache_key = hashlib.blake2b(orjson.dumps([title, date, topic, agenda, provided_kpis, all_kpis]), digest_size=16).digest()
+        hit = _OVERLAY_CACHE.get(cache_key)
+        if hit and hit[0] > time.monotonic():
+            return jsonify(hit[1])
+        match_failed = False
+
+        if not provided_kpis:
             # fallback la AI-ul de match deja existent
-            match = match_kpis_with_ai(title, topic, [{"title": a.get("title","")} for a in agenda], all_kpis)
-            provided_kpis = match.get("matched_kpis") or []
-
-        agenda_lines = "\n".join(
-            f"{(a.get('start') or '')}-{(a.get('end') or '')}: {(a.get('title') or '')}".strip("-: ")
-            for a in agenda
-        ).strip()
-        kpi_lines = "\n".join(f"- {k}" for k in provided_kpis).strip() or "—"
-
-        system = (
-            "You are a concise copywriter for internal tech newsletters. "
-            "Return ONLY valid JSON, no explanations."
-        )
-        prompt = f"""Create short on-image copy for THIS meeting's internal newsletter recap.
-Keep it punchy and scannable. Use ONLY the agenda and KPIs provided (do not invent extra topics).
-This is a recap, NOT an invitation; do NOT use 'join us', 'register', 'save the date', or similar.
-
-MEETING
-- Title: {title}
-- Date: {date}
-- Theme: {topic}
-
-AGENDA
-{agenda_lines or "—"}
-
-MATCHED KPIs (verbatim; only these are relevant)
-{kpi_lines}
-
-RULES
-- Strictly follow the JSON schema below. No extra keys.
-- <=60 chars for headline, <=80 for subheadline, <=80 per bullet.
-- 3–5 bullets max. No emojis. No CTA.
-
-SCHEMA
-{{
-  "headline": "string",
-  "subheadline": "string",
-  "bullets": ["string", "string", "string"]
-}}
-"""
+            provided_kpis, match_failed = _match_kpis_chunked(title, topic, [{"title": a.get("title","")} for a in agenda], all_kpis)
 
         # Use the dedicated function from gpt_utils
         meeting_data = {
@@ -1690,10 +2161,14 @@ SCHEMA
             "kpis": provided_kpis
         }
         result = generate_newsletter_overlay(meeting_data)
+        if not match_failed:
+            if len(_OVERLAY_CACHE) >= OVERLAY_CACHE_MAX:
+                _OVERLAY_CACHE.pop(next(iter(_OVERLAY_CACHE)), None)  # oldest insert
+            _OVERLAY_CACHE[cache_key] = (time.monotonic() + OVERLAY_CACHE_TTL, result)
         return jsonify(result)
 
     except Exception as e:
-        print("ERROR /api/newsletter-overlay:", e)
+        log.exception("/api/newsletter-overlay")
         # fallback simplu
         try:
             payload = request.json or {}
@@ -1722,10 +2197,20 @@ POINTS_CONFIG = {
     "debate_winner": 15
 }
 
-def add_automatic_points(member_email, criteria, reason, meeting_id=None, debate_id=None):
-    """Add points automatically based on criteria"""
+def add_automatic_points(member_email, criteria, reason, meeting_id=None, debate_id=None, data=None):
+    """Add points automatically based on criteria.
+
+    When data is given the entry is only added to it; the caller saves once for the whole batch.
+    """
     try:
-        data = load_data()
+        # Unknown criteria would only ever add a 0-point entry
+        points = POINTS_CONFIG.get(criteria)
+        if points is None:
+            return False
+        
+        batch = data is not None
+        if not batch:
+            data = load_data()
         
         # Check if member exists
         member = _member_by_email(data, member_email)
@@ -1737,28 +2222,17 @@ def add_automatic_points(member_email, criteria, reason, meeting_id=None, debate
             return False
         
         # Check if points already awarded for this specific event
-        points_entries = data.get("points_entries", [])
-        existing_entry = None
-        
         if meeting_id:
-            existing_entry = next((e for e in points_entries 
-                                 if e.get("member_email") == member_email 
-                                 and e.get("criteria") == criteria 
-                                 and e.get("meeting_id") == meeting_id), None)
-        elif debate_id:
-            existing_entry = next((e for e in points_entries 
-                                 if e.get("member_email") == member_email 
-                                 and e.get("criteria") == criteria 
-                                 and e.get("debate_id") == debate_id), None)
-        
-        if existing_entry:
+            debate_id = None  # meeting awards are keyed on the meeting only
+        if (meeting_id or debate_id) and \
+                (member_email, criteria, meeting_id, debate_id) in _index(data, "points_by_event"):
             return False  # Already awarded
         
         # Add points entry
         points_entry = {
-            "id": int(time.time() * 1000),
+            "id": _new_id(),
             "member_email": member_email,
-            "points": POINTS_CONFIG.get(criteria, 0),
+            "points": points,
             "reason": reason,
             "criteria": criteria,
             "added_by": "system",
@@ -1767,75 +2241,88 @@ def add_automatic_points(member_email, criteria, reason, meeting_id=None, debate
             "debate_id": debate_id
         }
         
-        if "points_entries" not in data:
-            data["points_entries"] = []
-        data["points_entries"].append(points_entry)
-        save_data(data)
+        _index_append(data, "points_by_event", points_entry)
+        if not batch:
+            save_data(data)
         
         return True
-    except Exception as e:
-        print(f"Error adding automatic points: {e}")
+    except Exception:
+        log.exception("Error adding automatic points")
         return False
 
-def award_meeting_attendance_points(meeting):
-    """Award points to all members who attended a meeting"""
+def award_meeting_attendance_points(meeting, data=None):
+    """Award points to all members who attended a meeting (into data if given; the caller saves)"""
     try:
+        batch = data is not None
+        if not batch:
+            data = load_data()
         participants = meeting.get("participants", [])
         meeting_id = meeting.get("id")
         
         for participant in participants:
             if participant.get("present", False):
-                member_email = participant.get("email", "").strip().lower()
+                member_email = _norm_email(participant.get("email"))
                 if member_email:
                     add_automatic_points(
                         member_email=member_email,
                         criteria="meeting_attendance",
                         reason=f"Attended meeting: {meeting.get('title', 'QA Meeting')}",
-                        meeting_id=meeting_id
+                        meeting_id=meeting_id,
+                        data=data
                     )
+        if not batch:
+            save_data(data)
         return True
-    except Exception as e:
-        print(f"Error awarding meeting attendance points: {e}")
+    except Exception:
+        log.exception("Error awarding meeting attendance points")
         return False
 
-def award_presentation_points(meeting):
-    """Award points to members who presented in agenda items"""
+def award_presentation_points(meeting, data=None):
+    """Award points to members who presented in agenda items (into data if given; the caller saves)"""
     try:
+        batch = data is not None
+        if not batch:
+            data = load_data()
         agenda = meeting.get("agenda", [])
         meeting_id = meeting.get("id")
         
+        participants = _participants_by_email_map(meeting)
         for agenda_item in agenda:
-            owner_email = agenda_item.get("ownerEmail", "").strip().lower()
+            owner_email = _norm_email(agenda_item.get("ownerEmail"))
             if owner_email:
                 # Check if this member was present at the meeting
-                participants = meeting.get("participants", [])
-                was_present = False
-                for participant in participants:
-                    if participant.get("email", "").strip().lower() == owner_email:
-                        was_present = participant.get("present", False)
-                        break
+                participant = participants.get(owner_email)
+                was_present = participant.get("present", False) if participant else False
                 
                 if was_present:
                     add_automatic_points(
                         member_email=owner_email,
                         criteria="presentation",
                         reason=f"Presented: {agenda_item.get('title', 'Agenda item')} in {meeting.get('title', 'QA Meeting')}",
-                        meeting_id=meeting_id
+                        meeting_id=meeting_id,
+                        data=data
                     )
+        if not batch:
+            save_data(data)
         return True
-    except Exception as e:
-        print(f"Error awarding presentation points: {e}")
+    except Exception:
+        log.exception("Error awarding presentation points")
         return False
 
-def award_debate_points(debate):
+def award_debate_points(debate, data=None):
     """Award points to debate participants and winners
     
     Rules:
     - Winners keep badge but get NO points (no participation points, no winner points)
     - Non-winning participants get participation points
     - Judges/jury get participation points
+
+    Entries go into data if given (the caller saves), else into a fresh load_data() that is saved here.
     """
     try:
+        batch = data is not None
+        if not batch:
+            data = load_data()
         debate_id = debate.get("id")
         teams = debate.get("teams", [])
         
@@ -1846,54 +2333,56 @@ def award_debate_points(debate):
             jury_scores = scores.get("jury", {})
             public_scores = scores.get("public", {})
             
-            # Calculate team totals
-            team_totals = {}
-            for team in teams:
-                team_id = team.get("id")
-                team_totals[team_id] = 0.0
-                
-                # Add jury scores
-                for step_scores in jury_scores.values():
-                    for judge_scores in step_scores.values():
-                        if team_id in judge_scores:
-                            if "default" in judge_scores[team_id]:
-                                team_totals[team_id] += float(judge_scores[team_id]["default"])
-                            else:
-                                for score in judge_scores[team_id].values():
-                                    team_totals[team_id] += float(score)
-                
-                # Add public scores (1 point per step won)
-                for step_scores in public_scores.values():
-                    if team_id in step_scores:
-                        team_totals[team_id] += float(step_scores[team_id])
+            # Calculate team totals: one pass over the scores, only counting this debate's teams
+            team_totals = {team.get("id"): 0.0 for team in teams}
+            
+            # Add jury scores
+            for step_scores in jury_scores.values():
+                for judge_scores in step_scores.values():
+                    for team_id, crits in judge_scores.items():
+                        if team_id not in team_totals:
+                            continue
+                        if "default" in crits:
+                            team_totals[team_id] += float(crits["default"])
+                        else:
+                            for score in crits.values():
+                                team_totals[team_id] += float(score)
+            
+            # Add public scores (1 point per step won)
+            for step_scores in public_scores.values():
+                for team_id, votes in step_scores.items():
+                    if team_id in team_totals:
+                        team_totals[team_id] += float(votes)
             
             # Find winning team(s)
             if team_totals:
                 max_score = max(team_totals.values())
                 winning_team_ids = set(team_id for team_id, score in team_totals.items() if score == max_score)
         
+        winner_teams = [team for team in teams if team.get("id") in winning_team_ids]
+        
         # Collect all winning team member emails (these get NO points, just badge)
-        winning_member_emails = set()
-        for team in teams:
-            if team.get("id") in winning_team_ids:
-                members = team.get("members", [])
-                for member_email in members:
-                    if member_email:
-                        winning_member_emails.add(member_email.strip().lower())
+        winning_member_emails = {
+            _norm_email(member_email)
+            for team in winner_teams
+            for member_email in team.get("members", [])
+            if member_email
+        }
         
         # Award participation points ONLY to non-winning team members
         for team in teams:
             members = team.get("members", [])
             for member_email in members:
                 if member_email:
-                    email_lower = member_email.strip().lower()
+                    email_lower = _norm_email(member_email)
                     # Skip winners - they get no points, just badge
                     if email_lower not in winning_member_emails:
                         add_automatic_points(
                             member_email=email_lower,
                             criteria="debate_participant",
                             reason=f"Participated in debate: {debate.get('affirmation', 'QA Debate')}",
-                            debate_id=debate_id
+                            debate_id=debate_id,
+                            data=data
                         )
         
         # Award participation points to judges/jury
@@ -1901,49 +2390,40 @@ def award_debate_points(debate):
         for judge_email in judges:
             if judge_email:
                 add_automatic_points(
-                    member_email=judge_email.strip().lower(),
+                    member_email=_norm_email(judge_email),
                     criteria="debate_participant",
                     reason=f"Jury member in debate: {debate.get('affirmation', 'QA Debate')}",
-                    debate_id=debate_id
+                    debate_id=debate_id,
+                    data=data
                 )
         
         # Award badge to winners (but with 0 points - they already got prize)
-        if debate.get("status") == "finished" and winning_team_ids:
-            for team in teams:
-                if team.get("id") in winning_team_ids:
-                    members = team.get("members", [])
-                    for member_email in members:
-                        if member_email:
-                            email_lower = member_email.strip().lower()
-                            # Create entry with 0 points to preserve badge, but no point accumulation
-                            try:
-                                data = load_data()
-                                points_entries = data.get("points_entries", [])
-                                # Check if badge entry already exists
-                                existing = next((e for e in points_entries 
-                                               if e.get("member_email") == email_lower 
-                                               and e.get("criteria") == "debate_winner" 
-                                               and e.get("debate_id") == debate_id), None)
-                                if not existing:
-                                    points_entry = {
-                                        "id": int(time.time() * 1000),
-                                        "member_email": email_lower,
-                                        "points": 0,  # 0 points - badge only
-                                        "reason": f"Won debate: {debate.get('affirmation', 'QA Debate')} (badge only, prize already awarded)",
-                                        "criteria": "debate_winner",
-                                        "added_by": "system",
-                                        "added_at": int(time.time()),
-                                        "debate_id": debate_id
-                                    }
-                                    points_entries.append(points_entry)
-                                    data["points_entries"] = points_entries
-                                    save_data(data)
-                            except Exception as e:
-                                print(f"Error awarding winner badge: {e}")
-        
+        if debate.get("status") == "finished" and winner_teams:
+            awarded = _index(data, "points_by_event")
+            for team in winner_teams:
+                members = team.get("members", [])
+                for member_email in members:
+                    if member_email:
+                        email_lower = _norm_email(member_email)
+                        if (email_lower, "debate_winner", None, debate_id) in awarded:
+                            continue
+                        # Create entry with 0 points to preserve badge, but no point accumulation
+                        _index_append(data, "points_by_event", {
+                            "id": _new_id(),
+                            "member_email": email_lower,
+                            "points": 0,  # 0 points - badge only
+                            "reason": f"Won debate: {debate.get('affirmation', 'QA Debate')} (badge only, prize already awarded)",
+                            "criteria": "debate_winner",
+                            "added_by": "system",
+                            "added_at": int(time.time()),
+                            "debate_id": debate_id
+                        })
+        
+        if not batch:
+            save_data(data)
         return True
-    except Exception as e:
-        print(f"Error awarding debate points: {e}")
+    except Exception:
+        log.exception("Error awarding debate points")
         return False
 
 @app.route("/api/rewards/points", methods=["GET", "POST"])
@@ -1952,7 +2432,7 @@ def rewards_points():
         data = load_data()
         if request.method == "POST":
             payload = request.json or {}
-            member_email = (payload.get("member_email") or "").strip().lower()
+            member_email = _norm_email(payload.get("member_email"))
             points = int(payload.get("points", 0))
             reason = (payload.get("reason") or "").strip()
             criteria = (payload.get("criteria") or "").strip()
@@ -1967,7 +2447,7 @@ def rewards_points():
             
             # Add points entry
             points_entry = {
-                "id": int(time.time() * 1000),
+                "id": _new_id(),
                 "member_email": member_email,
                 "points": points,
                 "reason": reason,
@@ -1976,28 +2456,25 @@ def rewards_points():
                 "added_at": int(time.time())
             }
             
-            if "points_entries" not in data:
-                data["points_entries"] = []
             data["points_entries"].append(points_entry)
             save_data(data)
             
             return jsonify({"status": "added", "entry": points_entry}), 200
         
         # GET - return all points entries
-        return jsonify(data.get("points_entries", []))
+        return jsonify(data["points_entries"])
     except Exception as e:
-        print("ERROR /api/rewards/points:", e)
+        log.exception("/api/rewards/points")
         return jsonify({"error": str(e)}), 500
 
-@app.route("/api/rewards/leaderboard", methods=["GET"])
-def rewards_leaderboard():
-    try:
-        data = load_data()
-        members = data.get("members", [])
-        points_entries = data.get("points_entries", [])
-        
-        # Calculate total points per member (excluding clan leads, external members, and inactive members)
-        member_points = {}
+_LEADERBOARD_MEMBERS = (None, ())  # (_SAVE_GEN, ((email, {name, email, studio, status}), ...))
+
+def _leaderboard_members(members):
+    """Members that can appear on the leaderboard, as (email, fields); rebuilt only after a save."""
+    global _LEADERBOARD_MEMBERS
+    gen = _SAVE_GEN
+    if _LEADERBOARD_MEMBERS[0] != gen:
+        rows = []
         for member in members:
             # Skip members marked as clan lead
             if member.get("clan_lead", False):
@@ -2009,94 +2486,105 @@ def rewards_leaderboard():
             member_status = (member.get("status") or "active").lower()
             if member_status in ("inactive", "inactive/maternity"):
                 continue
-                
-            email = (member.get("email") or "").strip().lower()
-            member_points[email] = {
+
+            email = _norm_email(member.get("email"))
+            rows.append((email, {
                 "name": member.get("name", ""),
                 "email": email,
                 "studio": member.get("studio", ""),
                 "status": member.get("status", "active"),
-                "total_points": 0,
-                "points_breakdown": {},
-                "recent_entries": []
-            }
-        
-        # Sum up points from entries
-        for entry in points_entries:
-            email = (entry.get("member_email") or "").strip().lower()
-            if email in member_points:
-                points = int(entry.get("points", 0))
-                criteria = entry.get("criteria", "manual")
-                
-                member_points[email]["total_points"] += points
-                
-                if criteria not in member_points[email]["points_breakdown"]:
-                    member_points[email]["points_breakdown"][criteria] = 0
-                member_points[email]["points_breakdown"][criteria] += points
-                
-                # Keep recent entries (last 10, but always include all debate_winner entries for badge display)
-                member_points[email]["recent_entries"].append({
-                    "points": points,
-                    "reason": entry.get("reason", ""),
-                    "criteria": criteria,
-                    "added_at": entry.get("added_at", 0)
-                })
-        
-        # Sort recent entries by date and limit, but preserve all debate_winner entries
-        for email in member_points:
-            all_entries = member_points[email]["recent_entries"]
-            # Separate debate_winner entries from others
-            debate_winner_entries = [e for e in all_entries if e.get("criteria") == "debate_winner"]
-            other_entries = [e for e in all_entries if e.get("criteria") != "debate_winner"]
-            
-            # Sort and limit other entries (last 10)
-            other_entries.sort(key=lambda x: x["added_at"], reverse=True)
-            other_entries = other_entries[:10]
-            
-            # Sort debate_winner entries by date
-            debate_winner_entries.sort(key=lambda x: x["added_at"], reverse=True)
-            
-            # Combine: debate_winner entries first (all of them), then other recent entries
-            member_points[email]["recent_entries"] = debate_winner_entries + other_entries
-        
-        # Calculate attendance percentage for each member based on meeting invitations
-        # Only count completed meetings (not scheduled/future meetings)
-        meetings = data.get("meetings", [])
-        for email in member_points:
-            invited_count = 0
-            attended_count = 0
+            }))
+        _LEADERBOARD_MEMBERS = (gen, tuple(rows))
+    return _LEADERBOARD_MEMBERS[1]
+
+def _leaderboard(data):
+    """Leaderboard rows, highest total first."""
+    members = data.get("members", [])
+    points_entries = data["points_entries"]
+    
+    # Calculate total points per member (excluding clan leads, external members, and inactive members)
+    member_points = {email: {**fields, "total_points": 0, "points_breakdown": {}, "recent_entries": []}
+                     for email, fields in _leaderboard_members(members)}
+    
+    # Sum up points from entries; recent entries are split by kind as they are collected
+    winner_entries = defaultdict(list)
+    other_entries = defaultdict(list)
+    for entry in points_entries:
+        email = _norm_email(entry.get("member_email"))
+        if email in member_points:
+            points = int(entry.get("points", 0))
+            criteria = entry.get("criteria", "manual")
             
-            for meeting in meetings:
-                # Only count completed meetings (exclude scheduled/future meetings)
-                if not isFinished(meeting):
-                    continue
-                    
-                participants = meeting.get("participants", [])
-                for participant in participants:
-                    participant_email = (participant.get("email") or "").strip().lower()
-                    if participant_email == email:
-                        invited_count += 1
-                        if participant.get("present", False):
-                            attended_count += 1
-                        break  # Found this member in this meeting, move to next meeting
+            member_points[email]["total_points"] += points
             
-            # Calculate attendance percentage
-            if invited_count > 0:
-                attendance_percentage = round((attended_count / invited_count) * 100, 1)
-            else:
-                attendance_percentage = 0.0
+            if criteria not in member_points[email]["points_breakdown"]:
+                member_points[email]["points_breakdown"][criteria] = 0
+            member_points[email]["points_breakdown"][criteria] += points
             
-            member_points[email]["attendance_percentage"] = attendance_percentage
-            member_points[email]["meetings_invited"] = invited_count
-            member_points[email]["meetings_attended"] = attended_count
+            # Keep recent entries (last 10, but always include all debate_winner entries for badge display)
+            (winner_entries if criteria == "debate_winner" else other_entries)[email].append(entry)
+    
+    # Sort recent entries by date and limit, but preserve all debate_winner entries.
+    # Only the entries that survive the cut are turned into response dicts.
+    by_date = lambda e: e.get("added_at", 0)
+    def recent_view(e):
+        return {
+            "points": int(e.get("points", 0)),
+            "reason": e.get("reason", ""),
+            "criteria": e.get("criteria", "manual"),
+            "added_at": e.get("added_at", 0)
+        }
+    for email, mp in member_points.items():
+        others = other_entries.get(email, [])
+        # last 10 other entries; a full sort only when there is nothing to cut
+        others = sorted(others, key=by_date, reverse=True) if len(others) <= 10 else heapq.nlargest(10, others, key=by_date)
+        # Combine: debate_winner entries first (all of them), then other recent entries
+        winners = sorted(winner_entries.get(email, []), key=by_date, reverse=True)
+        mp["recent_entries"] = [recent_view(e) for e in winners] + [recent_view(e) for e in others]
+    
+    # Calculate attendance percentage for each member based on meeting invitations
+    # Only count completed meetings (not scheduled/future meetings)
+    today = datetime.date.today().isoformat()
+    # Only count completed meetings (exclude scheduled/future meetings)
+    meetings = [m for m in data.get("meetings", []) if isFinished(m, today)]
+    for email in member_points:
+        invited_count = 0
+        attended_count = 0
         
-        # Convert to list and sort by total points
-        leaderboard = list(member_points.values())
-        leaderboard.sort(key=lambda x: x["total_points"], reverse=True)
+        for meeting in meetings:
+            participants = meeting.get("participants", [])
+            for participant in participants:
+                participant_email = _norm_email(participant.get("email"))
+                if participant_email == email:
+                    invited_count += 1
+                    if participant.get("present", False):
+                        attended_count += 1
+                    break  # Found this member in this meeting, move to next meeting
+        
+        # Calculate attendance percentage
+        if invited_count > 0:
+            attendance_percentage = round((attended_count / invited_count) * 100, 1)
+        else:
+            attendance_percentage = 0.0
         
-        return jsonify(leaderboard)
+        member_points[email]["attendance_percentage"] = attendance_percentage
+        member_points[email]["meetings_invited"] = invited_count
+        member_points[email]["meetings_attended"] = attended_count
+    
+    # Convert to list and sort by total points
+    leaderboard = list(member_points.values())
+    leaderboard.sort(key=lambda x: x["total_points"], reverse=True)
+    
+    return leaderboard
+
+@app.route("/api/rewards/leaderboard", methods=["GET"])
+def rewards_leaderboard():
+    try:
+        data = load_data()
+        # attendance only counts meetings before today, so a new day also invalidates the cached response
+        return _cached_json(("leaderboard",), lambda: _leaderboard(data), stamp=datetime.date.today())
     except Exception as e:
-        print("ERROR /api/rewards/leaderboard:", e)
+        log.exception("/api/rewards/leaderboard")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/rewards/criteria", methods=["GET", "POST"])
@@ -2113,88 +2601,82 @@ def rewards_criteria():
                 return jsonify({"error": "name and points required"}), 400
             
             criteria = {
-                "id": int(time.time() * 1000),
+                "id": _new_id(),
                 "name": name,
                 "points": points,
                 "description": description,
                 "created_at": int(time.time())
             }
             
-            if "points_criteria" not in data:
-                data["points_criteria"] = []
             data["points_criteria"].append(criteria)
             save_data(data)
             
             return jsonify({"status": "added", "criteria": criteria}), 200
         
         # GET - return all criteria
-        return jsonify(data.get("points_criteria", []))
+        return jsonify(data["points_criteria"])
     except Exception as e:
-        print("ERROR /api/rewards/criteria:", e)
+        log.exception("/api/rewards/criteria")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/rewards/criteria/<int:criteria_id>", methods=["DELETE"])
 def delete_criteria(criteria_id):
     try:
         data = load_data()
-        criteria_list = data.get("points_criteria", [])
-        
         # Find and remove criteria
-        for i, criteria in enumerate(criteria_list):
-            if criteria.get("id") == criteria_id:
-                removed = criteria_list.pop(i)
-                data["points_criteria"] = criteria_list
-                save_data(data)
-                return jsonify({"status": "deleted", "removed": removed}), 200
-        
-        return jsonify({"error": "Criteria not found"}), 404
+        removed = _index_remove(data, "criteria_by_id", criteria_id)
+        if removed is None:
+            return jsonify({"error": "Criteria not found"}), 404
+        save_data(data)
+        return jsonify({"status": "deleted", "removed": removed}), 200
     except Exception as e:
-        print("ERROR /api/rewards/criteria/<id>:", e)
+        log.exception("/api/rewards/criteria/<id>")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/rewards/points/<int:entry_id>", methods=["DELETE"])
 def delete_points_entry(entry_id):
     try:
         data = load_data()
-        points_entries = data.get("points_entries", [])
-        
         # Find and remove entry
-        for i, entry in enumerate(points_entries):
-            if entry.get("id") == entry_id:
-                removed = points_entries.pop(i)
-                data["points_entries"] = points_entries
-                save_data(data)
-                return jsonify({"status": "deleted", "removed": removed}), 200
-        
-        return jsonify({"error": "Entry not found"}), 404
+        removed = _index_remove(data, "points_by_id", entry_id)
+        if removed is None:
+            return jsonify({"error": "Entry not found"}), 404
+        save_data(data)
+        return jsonify({"status": "deleted", "removed": removed}), 200
     except Exception as e:
-        print("ERROR /api/rewards/points/<id>:", e)
+        log.exception("/api/rewards/points/<id>")
         return jsonify({"error": str(e)}), 500
 
+def _award_all_finished():
+    """Award points for every finished meeting and debate; one save. Returns (meetings, debates) awarded."""
+    data = load_data()
+    awarded_meetings = 0
+    awarded_debates = 0
+    
+    # Award points for all completed meetings (all into data, saved once below)
+    today = datetime.date.today().isoformat()
+    for meeting in data["meetings"]:
+        if isFinished(meeting, today):
+            if award_meeting_attendance_points(meeting, data):
+                awarded_meetings += 1
+            # Also award presentation points
+            award_presentation_points(meeting, data)
+    
+    # Award points for all finished debates
+    for debate in data["debates"]:
+        if debate.get("status") == "finished":
+            if award_debate_points(debate, data):
+                awarded_debates += 1
+    save_data(data)
+    return awarded_meetings, awarded_debates
+
 @app.route("/api/rewards/award-retroactive", methods=["POST"])
 def award_retroactive_points():
     """Award points for all past meetings and debates"""
     try:
-        data = load_data()
-        meetings = data.get("meetings", [])
-        debates = data.get("debates", [])
-        
-        awarded_meetings = 0
-        awarded_debates = 0
-        
-        # Award points for all completed meetings
-        for meeting in meetings:
-            if isFinished(meeting):
-                if award_meeting_attendance_points(meeting):
-                    awarded_meetings += 1
-                # Also award presentation points
-                award_presentation_points(meeting)
-        
-        # Award points for all finished debates
-        for debate in debates:
-            if debate.get("status") == "finished":
-                if award_debate_points(debate):
-                    awarded_debates += 1
+        # Runs on the awards worker so it never interleaves with a debate award
+        # from live_stop (both dedup against and append to points_entries)
+        awarded_meetings, awarded_debates = _AWARD_EXEC.submit(_award_all_finished).result()
         
         return jsonify({
             "status": "completed",
@@ -2203,99 +2685,121 @@ def award_retroactive_points():
             "message": f"Awarded points for {awarded_meetings} meetings and {awarded_debates} debates"
         })
     except Exception as e:
-        print("ERROR /api/rewards/award-retroactive:", e)
+        log.exception("/api/rewards/award-retroactive")
+        return jsonify({"error": str(e)}), 500
+
+@app.route("/api/admin/backup", methods=["POST"])
+def admin_backup():
+    """Write the in-memory backups to disk now instead of waiting for shutdown"""
+    try:
+        return jsonify({"status": "ok", "files": spill_backup_ring()})
+    except Exception as e:
+        log.exception("/api/admin/backup")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/rewards/recalculate-points", methods=["POST"])
 def recalculate_all_points():
     """Reset and recalculate all automatic points (meeting attendance, presentations, debates)"""
     try:
-        # Create explicit backup before recalculating
-        backup_name = f"{DATA_FILE}.before_recalculate.{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        if os.path.exists(DATA_FILE):
-            shutil.copy2(DATA_FILE, backup_name)
-            print(f"Created backup before recalculate: {backup_name}")
-        
-        data = load_data()
-        
-        # Validate data structure before proceeding
-        if not isinstance(data, dict):
-            raise ValueError("Invalid data structure")
-        
-        # Verify critical data exists
-        if "members" not in data or "meetings" not in data:
-            raise ValueError("Critical data missing - aborting recalculate to prevent data loss")
-        
-        points_entries = data.get("points_entries", [])
-        meetings = data.get("meetings", [])
-        debates = data.get("debates", [])
-        
-        # Remove all automatic points entries (system-awarded, not manual)
-        automatic_criteria = ("meeting_attendance", "presentation", "debate_participant", "debate_winner")
-        automatic_entries = [e for e in points_entries 
-                            if e.get("criteria") in automatic_criteria 
-                            and e.get("added_by") == "system"]
-        
-        remaining_entries = [e for e in points_entries 
-                            if e not in automatic_entries]
-        
-        data["points_entries"] = remaining_entries
-        save_data(data)
-        
-        # Re-award points for all finished meetings
-        recalculated_meetings = 0
-        recalculated_presentations = 0
-        for meeting in meetings:
-            if isFinished(meeting):
-                if award_meeting_attendance_points(meeting):
-                    recalculated_meetings += 1
-                if award_presentation_points(meeting):
-                    recalculated_presentations += 1
-        
-        # Re-award points for all finished debates using new rules
-        recalculated_debates = 0
-        for debate in debates:
-            if debate.get("status") == "finished":
-                if award_debate_points(debate):
-                    recalculated_debates += 1
-        
-        return jsonify({
-            "status": "completed",
-            "removed_entries": len(automatic_entries),
-            "recalculated_meetings": recalculated_meetings,
-            "recalculated_presentations": recalculated_presentations,
-            "recalculated_debates": recalculated_debates,
-            "message": f"Reset {len(automatic_entries)} automatic points entries. Recalculated: {recalculated_meetings} meetings, {recalculated_presentations} presentations, {recalculated_debates} debates"
-        })
+        # Runs on the awards worker: a debate award queued by live_stop must not land
+        # between the reset and the re-award (lost or doubled entries)
+        return jsonify(_AWARD_EXEC.submit(_recalculate_points).result())
     except Exception as e:
-        print("ERROR /api/rewards/recalculate-points:", e)
+        log.exception("/api/rewards/recalculate-points")
         return jsonify({"error": str(e)}), 500
 
+def _recalculate_points():
+    """Drop all system-awarded points and award them again from meetings and debates; one save."""
+    # Create explicit backup before recalculating (fold the WAL in first so the copy is complete)
+    load_data()
+    _compact()
+    backup_name = f"{DATA_FILE}.before_recalculate.{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    if os.path.exists(DATA_FILE):
+        shutil.copy2(DATA_FILE, backup_name)
+        log.info("Created backup before recalculate: %s", backup_name)
+    
+    data = load_data()
+    
+    # Validate data structure before proceeding
+    if not isinstance(data, dict):
+        raise ValueError("Invalid data structure")
+    
+    # Verify critical data exists
+    if "members" not in data or "meetings" not in data:
+        raise ValueError("Critical data missing - aborting recalculate to prevent data loss")
+    
+    points_entries = data["points_entries"]
+    meetings = data["meetings"]
+    debates = data["debates"]
+    
+    # Remove all automatic points entries (system-awarded, not manual)
+    automatic_criteria = {"meeting_attendance", "presentation", "debate_participant", "debate_winner"}
+    automatic_entries = []
+    remaining_entries = []
+    for e in points_entries:
+        is_automatic = e.get("criteria") in automatic_criteria and e.get("added_by") == "system"
+        (automatic_entries if is_automatic else remaining_entries).append(e)
+    
+    # in place: the list stays the one data (and the points indexes) refer to
+    points_entries[:] = remaining_entries
+    _drop_indexes("points_entries")
+    
+    # Re-award points for all finished meetings (all into data, saved once below)
+    recalculated_meetings = 0
+    recalculated_presentations = 0
+    today = datetime.date.today().isoformat()
+    for meeting in meetings:
+        if isFinished(meeting, today):
+            if award_meeting_attendance_points(meeting, data):
+                recalculated_meetings += 1
+            if award_presentation_points(meeting, data):
+                recalculated_presentations += 1
+    
+    # Re-award points for all finished debates using new rules
+    recalculated_debates = 0
+    for debate in debates:
+        if debate.get("status") == "finished":
+            if award_debate_points(debate, data):
+                recalculated_debates += 1
+    save_data(data)
+    
+    return {
+        "status": "completed",
+        "removed_entries": len(automatic_entries),
+        "recalculated_meetings": recalculated_meetings,
+        "recalculated_presentations": recalculated_presentations,
+        "recalculated_debates": recalculated_debates,
+        "message": f"Reset {len(automatic_entries)} automatic points entries. Recalculated: {recalculated_meetings} meetings, {recalculated_presentations} presentations, {recalculated_debates} debates"
+    }
+
 @app.route("/api/rewards/cleanup-orphaned", methods=["POST"])
 def cleanup_orphaned_points():
     """Remove points entries for deleted meetings and debates"""
     try:
         data = load_data()
-        meetings = data.get("meetings", [])
-        debates = data.get("debates", [])
-        points_entries = data.get("points_entries", [])
+        meetings = data["meetings"]
+        debates = data["debates"]
+        points_entries = data["points_entries"]
         
-        # Get valid meeting and debate IDs
-        valid_meeting_ids = {str(m.get("id")) for m in meetings}
-        valid_debate_ids = {str(d.get("id")) for d in debates}
+        # Get valid meeting and debate IDs, compared as stored (ints); the str() sets are only
+        # consulted on a miss, for ids that were saved as strings on one side
+        valid_meeting_ids = {m.get("id") for m in meetings if m.get("id") is not None}
+        valid_debate_ids = {d.get("id") for d in debates if d.get("id") is not None}
+        meeting_id_strs = {str(i) for i in valid_meeting_ids}
+        debate_id_strs = {str(i) for i in valid_debate_ids}
         
         # Count orphaned entries
         orphaned_count = 0
         cleaned_entries = []
         
         for entry in points_entries:
-            meeting_id = str(entry.get("meeting_id", ""))
-            debate_id = str(entry.get("debate_id", ""))
+            meeting_id = entry.get("meeting_id") or None  # "" counts as missing, as before
+            debate_id = entry.get("debate_id") or None
             
             # Keep entry if it has a valid meeting or debate ID, or if it's manual (no meeting/debate ID)
-            if (meeting_id and meeting_id in valid_meeting_ids) or \
-               (debate_id and debate_id in valid_debate_ids) or \
-               (not meeting_id and not debate_id):
+            if (meeting_id is not None and (meeting_id in valid_meeting_ids or str(meeting_id) in meeting_id_strs)) or \
+               (debate_id is not None and (debate_id in valid_debate_ids or str(debate_id) in debate_id_strs)) or \
+               (meeting_id is None and debate_id is None):
                 cleaned_entries.append(entry)
             else:
                 orphaned_count += 1
@@ -2311,18 +2815,19 @@ def cleanup_orphaned_points():
             "message": f"Removed {orphaned_count} orphaned points entries"
         })
     except Exception as e:
-        print("ERROR /api/rewards/cleanup-orphaned:", e)
+        log.exception("/api/rewards/cleanup-orphaned")
         return jsonify({"error": str(e)}), 500
 
-def isFinished(meeting):
-    """Check if meeting is finished (date has passed)"""
+def isFinished(meeting, today=None):
+    """Check if meeting is finished (date has passed).
+
+    today is "YYYY-MM-DD"; loops over many meetings pass it in instead of formatting it per call.
+    """
     try:
         meeting_date = meeting.get("date", "")
         if not meeting_date:
             return False
-        from datetime import datetime
-        today = datetime.now().strftime("%Y-%m-%d")
-        return meeting_date < today
+        return meeting_date < (today or datetime.date.today().isoformat())
     except:
         return False
 
@@ -2332,6 +2837,43 @@ def isFinished(meeting):
 
 # Optional: Teams Incoming Webhook for one-click send
 TEAMS_WEBHOOK_URL = os.getenv("TEAMS_WEBHOOK_URL", "")
+TEAMS_WEBHOOK_TIMEOUT = 10  # seconds
+_TEAMS_CONN = threading.local()  # per-thread keep-alive connection to the webhook host
+
+def _teams_post(payload):
+    """POST payload (bytes) to TEAMS_WEBHOOK_URL over this thread's kept-alive connection.
+
+    The POST is not idempotent: it is only resent when sending it on a reused
+    connection failed (the server had closed it), never once the request went out.
+    """
+    url = urlsplit(TEAMS_WEBHOOK_URL)
+    path = (url.path or "/") + (f"?{url.query}" if url.query else "")
+    headers = {"Content-Type": "application/json"}
+    for attempt in (0, 1):
+        conn = getattr(_TEAMS_CONN, "conn", None)
+        reused = conn is not None and getattr(_TEAMS_CONN, "netloc", None) == url.netloc
+        if not reused:
+            if conn is not None:
+                conn.close()
+            cls = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+            conn = _TEAMS_CONN.conn = cls(url.netloc, timeout=TEAMS_WEBHOOK_TIMEOUT)
+            _TEAMS_CONN.netloc = url.netloc
+        sent = False
+        try:
+            conn.request("POST", path, body=payload, headers=headers)
+            sent = True
+            resp = conn.getresponse()
+            body = resp.read()
+        except (OSError, http.client.HTTPException):
+            # timeouts included: a half-used connection must not serve the next send
+            conn.close()
+            _TEAMS_CONN.conn = None
+            if sent or not reused or attempt:
+                raise
+            continue
+        if resp.status >= 400:
+            raise RuntimeError(f"Teams webhook returned HTTP {resp.status}: {body[:200]!r}")
+        return
 
 @app.route("/api/feedback/forms", methods=["GET", "POST", "PUT", "DELETE"])
 def feedback_forms():
@@ -2347,7 +2889,7 @@ def feedback_forms():
                 return jsonify({"error": "meeting_id, title, questions obligatorii"}), 400
             if not _meeting_by_id(data, mid):
                 return jsonify({"error": "Meeting not found"}), 404
-            fid = int(time.time() * 1000)
+            fid = _new_id()
             form = {
                 "id": fid,
                 "meeting_id": mid,
@@ -2358,7 +2900,7 @@ def feedback_forms():
                 "created_at": int(time.time()),
                 "qr": None,
             }
-            data["feedback_forms"].append(form)
+            _index_append(data, "feedback_forms_by_id", form)
             save_data(data)
             return jsonify({"status": "saved", "id": fid}), 200
 
@@ -2367,43 +2909,44 @@ def feedback_forms():
             fid = p.get("id")
             if not fid:
                 return jsonify({"error": "Missing id"}), 400
-            fs = data.get("feedback_forms", [])
-            for i, f in enumerate(fs):
-                if str(f.get("id")) == str(fid):
-                    if f.get("responses"):
-                        p.pop("meeting_id", None)  # don't change meeting after responses
-                    for k in ("title", "description", "questions"):
-                        if k in p:
-                            fs[i][k] = p[k]
-                    data["feedback_forms"] = fs
-                    save_data(data)
-                    return jsonify({"status": "updated"}), 200
+            f = _feedback_form_by_id(data, fid)
+            if not f:
+                return jsonify({"error": "Form not found"}), 404
+            if f.get("responses"):
+                p.pop("meeting_id", None)  # don't change meeting after responses
+            for k in ("title", "description", "questions"):
+                if k in p:
+                    f[k] = p[k]
+            save_data(data)
+            return jsonify({"status": "updated"}), 200
 
         if request.method == "DELETE":
             fid = request.args.get("id")
             if not fid:
                 return jsonify({"error": "Missing id"}), 400
-            fs = [f for f in data.get("feedback_forms", []) if str(f.get("id")) != str(fid)]
-            data["feedback_forms"] = fs
-            save_data(data)
+            if _index_remove(data, "feedback_forms_by_id", str(fid)) is not None:
+                save_data(data)
             return jsonify({"status": "deleted"}), 200
 
         # GET
         mid = request.args.get("meeting_id")
-        fs = data.get("feedback_forms", [])
-        if mid:
-            fs = [f for f in fs if str(f.get("meeting_id")) == str(mid)]
-        # —— compat: propagate qr_url/form_url to top level for UI —
-        out = []
-        for f in fs:
-            f2 = dict(f)
-            if isinstance(f2.get("qr"), dict):
-                f2["qr_url"] = f2["qr"].get("qr_url")
-                f2["form_url"] = f2["qr"].get("url")
-            out.append(f2)
-        return jsonify(out)
+
+        def build():
+            fs = data["feedback_forms"]
+            if mid:
+                fs = [f for f in fs if str(f.get("meeting_id")) == str(mid)]
+            # —— compat: propagate qr_url/form_url to top level for UI —
+            out = []
+            for f in fs:
+                f2 = dict(f)
+                if isinstance(f2.get("qr"), dict):
+                    f2["qr_url"] = f2["qr"].get("qr_url")
+                    f2["form_url"] = f2["qr"].get("url")
+                out.append(f2)
+            return out
+        return _cached_json(("feedback_forms", mid or ""), build)
     except Exception as e:
-        print("ERROR /api/feedback/forms:", e)
+        log.exception("/api/feedback/forms")
         return jsonify({"error": str(e)}), 500
 
 # QR pentru feedback form
@@ -2411,185 +2954,205 @@ def feedback_forms():
 def feedback_qr(fid):
     try:
         data = load_data()
-        fs = data.get("feedback_forms", [])
-        form = next((f for f in fs if str(f.get("id")) == str(fid)), None)
+        form = _feedback_form_by_id(data, fid)
         if not form:
                             return jsonify({"error": "Form not found"}), 404
         url = url_for("feedback_fill", fid=fid, _external=True)
         qr_url, ts = _versioned_qr_png(url, f"qr_fb_{fid}")
-        form["qr"] = {"url": url, "qr_url": qr_url, "ts": ts}
-        for i, f in enumerate(fs):
-            if str(f.get("id")) == str(fid):
-                fs[i] = form
-                break
-        data["feedback_forms"] = fs
-        save_data(data)
+        qr = {"url": url, "qr_url": qr_url, "ts": ts}
+        if form.get("qr") != qr:  # the editor re-posts this on every change; usually nothing moved
+            form["qr"] = qr
+            save_data(data)
         # —— compat: include form_url alias for frontend —
         return jsonify({"qr_url": qr_url, "url": url, "form_url": url, "ts": ts})
     except Exception as e:
-        print("ERROR /api/feedback/forms/<fid>/qr:", e)
+        log.exception("/api/feedback/forms/<fid>/qr")
         return jsonify({"error": str(e)}), 500
 
+FEEDBACK_MSG_CACHE_TTL = 600  # seconds a generated feedback message is reused for the same prompt
+FEEDBACK_MSG_CACHE_MAX = 128
+_FEEDBACK_MSG_CACHE = {}      # blake2b of the prompt -> (expires_at, message text)
+FEEDBACK_AGENDA_MAX = 5       # agenda titles passed to the model
+FEEDBACK_MSG_MAX_TOKENS = 150  # 2-4 short lines plus the link
+FEEDBACK_MSG_SYSTEM = (
+    "Write a 2-4 line English Teams message politely asking colleagues for meeting feedback. "
+    "Collegial, no emojis, no marketing CTA. Include the link. Output only the message."
+)
+
 # helper: build AI feedback message (avoid logic duplication)
-def _build_feedback_ai_message(form, extra_suggestions=""):
+def _build_feedback_ai_message(form, extra_suggestions="", url=None):
+    """url: the form link; resolved here when not given (needs a request context)."""
     data = load_data()
     mt = _meeting_by_id(data, form.get("meeting_id")) or {}
-    url = form.get("qr", {}).get("url") or url_for("feedback_fill", fid=form.get("id"), _external=True)
+    url = url or (form.get("qr") or {}).get("url") or url_for("feedback_fill", fid=form.get("id"), _external=True)
     title = mt.get("title", "QA Meeting")
     date = mt.get("date", "")
     topic = mt.get("topic", "")
     agenda = mt.get("agenda", [])
     
-    # Build agenda context
-    agenda_context = ""
-    if agenda:
-        agenda_items = [f"- {a.get('start', '')}-{a.get('end', '')}: {a.get('title', '')}" for a in agenda if a.get('title')]
-        agenda_context = "\n".join(agenda_items)
-    
-    system = (
-        "You write short, warm internal messages asking colleagues to fill feedback. "
-        "Do NOT use marketing-y CTA. Keep it 2-4 short lines. English language. "
-        "Return ONLY the message content, no prefixes like 'Here is a message:' or similar."
-    )
-    
-    prompt = f"""
-Write a short message (2–4 lines) in English for Teams asking for feedback.
-Meeting context: {title} ({date}) – {topic}
-{f"Agenda covered: {agenda_context}" if agenda_context else ""}
-Politely say we are waiting for feedback.
-Include this link explicitly: {url}
-Avoid emojis; collegial tone.
-{f"Additional context: {extra_suggestions}" if extra_suggestions.strip() else ""}
-
-Return ONLY the message text, no explanations or prefixes.
-"""
-    resp = _llm.chat.completions.create(
-        model=LM_MODEL_ID,
-        messages=[{"role": "system", "content": system}, {"role": "user", "content": prompt}],
-        temperature=0.3,
-    )
-    text = (resp.choices[0].message.content or "").strip()
-    return {"text": text, "message": text, "link": url, "qr_url": form.get("qr", {}).get("qr_url")}
+    # Only what the message can use: agenda titles (no times), the link, optional extras
+    agenda_titles = [a.get("title") for a in agenda if a.get("title")][:FEEDBACK_AGENDA_MAX]
+    lines = [f"Meeting: {title} ({date}) – {topic}"]
+    if agenda_titles:
+        lines.append("Agenda: " + "; ".join(agenda_titles))
+    lines.append(f"Link (include it): {url}")
+    if extra_suggestions.strip():
+        lines.append(f"Extra: {extra_suggestions.strip()}")
+    prompt = "\n".join(lines)
+    # the prompt carries everything the message depends on (meeting, agenda, link, extras),
+    # so a changed meeting simply produces a new key
+    cache_key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+    hit = _FEEDBACK_MSG_CACHE.get(cache_key)
+    if hit and hit[0] > time.monotonic():
+        text = hit[1]
+    else:
+        resp = get_client().chat.completions.create(
+            model=LM_MODEL_ID,
+            messages=[{"role": "system", "content": FEEDBACK_MSG_SYSTEM}, {"role": "user", "content": prompt}],
+            temperature=0.3,
+            max_tokens=FEEDBACK_MSG_MAX_TOKENS,
+        )
+        text = (resp.choices[0].message.content or "").strip()
+        if text:
+            if len(_FEEDBACK_MSG_CACHE) >= FEEDBACK_MSG_CACHE_MAX:
+                _FEEDBACK_MSG_CACHE.pop(next(iter(_FEEDBACK_MSG_CACHE)), None)  # oldest insert
+            _FEEDBACK_MSG_CACHE[cache_key] = (time.monotonic() + FEEDBACK_MSG_CACHE_TTL, text)
+    return {"text": text, "message": text, "link": url, "qr_url": (form.get("qr") or {}).get("qr_url")}
 
 # Copie AI pentru Teams (mesaj scurt, colegial)
+# —— ALIAS compat pentru frontend: /ai-teams (identic cu /ai-copy) —
 @app.route("/api/feedback/forms/<fid>/ai-copy", methods=["POST"])
+@app.route("/api/feedback/forms/<fid>/ai-teams", methods=["POST"])
 def feedback_ai_copy(fid):
     try:
         data = load_data()
-        form = next((f for f in data.get("feedback_forms", []) if str(f.get("id")) == str(fid)), None)
+        form = _feedback_form_by_id(data, fid)
         if not form:
             return jsonify({"error": "Form not found"}), 404
         
         payload = request.json or {}
         extra_suggestions = payload.get("extra_suggestions", "")
+        if request.args.get("async") == "1":
+            # don't hold this worker for the LLM round-trip; poll /api/feedback/ai-jobs/<job_id>
+            url = (form.get("qr") or {}).get("url") or url_for("feedback_fill", fid=fid, _external=True)
+            fut = _LLM_EXEC.submit(_build_feedback_ai_message, form, extra_suggestions, url)
+            return jsonify({"job_id": _add_ai_job(fut), "status": "pending"}), 202
         out = _build_feedback_ai_message(form, extra_suggestions)
         return jsonify(out)
     except Exception as e:
-        print("ERROR /api/feedback/forms/<fid>/ai-copy:", e)
+        log.exception("/api/feedback/forms/<fid>/ai-copy")
         return jsonify({"error": str(e)}), 500
 
-# —— ALIAS compat pentru frontend: /ai-teams (identic cu /ai-copy) —
-@app.route("/api/feedback/forms/<fid>/ai-teams", methods=["POST"])
-def feedback_ai_teams(fid):
-    try:
-        data = load_data()
-        form = next((f for f in data.get("feedback_forms", []) if str(f.get("id")) == str(fid)), None)
-        if not form:
-            return jsonify({"error": "Form not found"}), 404
-        
-        payload = request.json or {}
-        extra_suggestions = payload.get("extra_suggestions", "")
-        out = _build_feedback_ai_message(form, extra_suggestions)
-        return jsonify(out)
+AI_JOB_TTL = 600  # seconds an unclaimed AI job result is kept
+_AI_JOBS = {}     # job id -> (created at, Future)
+_AI_JOBS_LOCK = threading.Lock()
+
+def _add_ai_job(fut):
+    jid = secrets.token_urlsafe(9)
+    now = time.monotonic()
+    with _AI_JOBS_LOCK:
+        for k in [k for k, (t, _) in _AI_JOBS.items() if now - t > AI_JOB_TTL]:
+            del _AI_JOBS[k]
+        _AI_JOBS[jid] = (now, fut)
+    return jid
+
+@app.route("/api/feedback/ai-jobs/<jid>", methods=["GET"])
+def feedback_ai_job(jid):
+    """Result of an ?async=1 /ai-copy call: 202 while the LLM is still working."""
+    with _AI_JOBS_LOCK:
+        job = _AI_JOBS.get(jid)
+        if job and job[1].done():
+            del _AI_JOBS[jid]
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    fut = job[1]
+    if not fut.done():
+        return jsonify({"status": "pending"}), 202
+    try:
+        return jsonify({"status": "done", **fut.result()})
     except Exception as e:
-        print("ERROR /api/feedback/forms/<fid>/ai-teams:", e)
+        log.error("/api/feedback/ai-jobs/<jid>: %s", e)
         return jsonify({"error": str(e)}), 500
 
+def _rating_value(v):
+    """v as a finite float, or None (missing / not a number)."""
+    if v is None:
+        return None
+    try:
+        fv = float(v)
+    except (TypeError, ValueError):
+        return None
+    return fv if math.isfinite(fv) else None
+
+def _rating_summary(vals):
+    """(avg or None, {"rounded rating": count}) for a list of float ratings."""
+    if not vals:
+        return None, {}
+    return sum(vals) / len(vals), dict(Counter(str(int(round(fv))) for fv in vals))
+
 def _aggregate_feedback(form):
     qs = form.get("questions") or []
     resp = form.get("responses") or {}
     aggr = {"total_responses": len(resp), "questions": []}
 
     # responses are stored as { email: { ts, answers: {qid: value|[values]} } }
+    # One pass over the responses splits the answers into a column per question (in
+    # response order); each question below then only reads the answers given to it.
+    columns = {q.get("id"): [] for q in qs}
+    for r in resp.values():
+        for qid, v in (r.get("answers") or {}).items():
+            col = columns.get(qid)
+            if col is not None:
+                col.append(v)
+
     for q in qs:
         qid = q.get("id")
         qtype = (q.get("type") or "text").lower()
         title = q.get("title") or ""
         entry = {"title": title, "type": qtype}
+        given = columns[qid]
 
         if qtype in ("single", "multi"):
             opts = [str(o) for o in (q.get("options") or [])]
-            counts = {o: 0 for o in opts}
-            for r in resp.values():
-                a = (r.get("answers") or {}).get(qid)
-                if qtype == "single":
-                    if a is not None:
-                        s = str(a)
-                        if s in counts:
-                            counts[s] += 1
-                else:
-                    if isinstance(a, list):
-                        for s in map(str, a):
-                            if s in counts:
-                                counts[s] += 1
-            entry["options"] = [{"value": o, "count": counts[o]} for o in opts]
+            if qtype == "single":
+                votes = Counter(str(v) for v in given if v is not None)
+            else:
+                votes = Counter(str(s) for v in given if isinstance(v, list) for s in v)
+            # answers that are not one of the options are simply never read back
+            entry["options"] = [{"value": o, "count": votes[o]} for o in opts]
 
         elif qtype == "rating":
-            total = 0.0
-            cnt = 0
-            dist = {}
-            for r in resp.values():
-                v = (r.get("answers") or {}).get(qid)
-                try:
-                    if v is None:
-                        continue
-                    fv = float(v)
-                    total += fv
-                    cnt += 1
-                    key = str(int(round(fv)))
-                    dist[key] = dist.get(key, 0) + 1
-                except Exception:
-                    pass
-            entry["avg"] = (total / cnt) if cnt else None
-            entry["counts"] = dist
+            vals = [fv for fv in map(_rating_value, given) if fv is not None]
+            entry["avg"], entry["counts"] = _rating_summary(vals)
 
         elif qtype == "rating_presenter":
             # For rating_presenter, answers is an object: { "presenter1": 4, "presenter2": 5 }
             presenters = q.get("presenters", [])
-            presenter_ratings = {p: {"total": 0.0, "count": 0, "dist": {}} for p in presenters}
+            presenter_vals = {p: [] for p in presenters}
             
-            for r in resp.values():
-                v = (r.get("answers") or {}).get(qid)
+            for v in given:
                 if isinstance(v, dict):
                     for presenter, rating in v.items():
-                        if presenter in presenter_ratings:
-                            try:
-                                fv = float(rating)
-                                presenter_ratings[presenter]["total"] += fv
-                                presenter_ratings[presenter]["count"] += 1
-                                key = str(int(round(fv)))
-                                presenter_ratings[presenter]["dist"][key] = presenter_ratings[presenter]["dist"].get(key, 0) + 1
-                            except Exception:
-                                pass
+                        vals = presenter_vals.get(presenter)
+                        if vals is not None:
+                            fv = _rating_value(rating)
+                            if fv is not None:
+                                vals.append(fv)
             
             # Format presenter ratings
             entry["presenter_ratings"] = []
             for presenter in presenters:
-                pr = presenter_ratings[presenter]
+                vals = presenter_vals[presenter]
+                avg, dist = _rating_summary(vals)
                 entry["presenter_ratings"].append({
                     "presenter": presenter,
-                    "avg": (pr["total"] / pr["count"]) if pr["count"] > 0 else None,
-                    "count": pr["count"],
-                    "counts": pr["dist"]
+                    "avg": avg,
+                    "count": len(vals),
+                    "counts": dist
                 })
 
         else:  # text
-            texts = []
-            for r in resp.values():
-                v = (r.get("answers") or {}).get(qid)
-                if isinstance(v, str) and v.strip():
-                    texts.append(v.strip())
-            entry["responses"] = texts
+            entry["responses"] = [v.strip() for v in given if isinstance(v, str) and v.strip()]
 
         aggr["questions"].append(entry)
 
@@ -2600,20 +3163,21 @@ def _aggregate_feedback(form):
 def get_feedback_form(fid):
     try:
         data = load_data()
-        form = next((f for f in data.get("feedback_forms", []) if str(f.get("id")) == str(fid)), None)
+        form = _feedback_form_by_id(data, fid)
         if not form:
             return jsonify({"error": "Form not found"}), 404
         
-        # Get meeting data for context
-        meeting = _meeting_by_id(data, form.get("meeting_id")) or {}
-        form_with_meeting = dict(form)
-        form_with_meeting["meeting_title"] = meeting.get("title", "")
-        form_with_meeting["meeting_date"] = meeting.get("date", "")
-        form_with_meeting["meeting_topic"] = meeting.get("topic", "")
-        
-        return jsonify(form_with_meeting)
+        def build():
+            # Get meeting data for context
+            meeting = _meeting_by_id(data, form.get("meeting_id")) or {}
+            form_with_meeting = dict(form)
+            form_with_meeting["meeting_title"] = meeting.get("title", "")
+            form_with_meeting["meeting_date"] = meeting.get("date", "")
+            form_with_meeting["meeting_topic"] = meeting.get("topic", "")
+            return form_with_meeting
+        return _cached_json(("feedback_form", str(fid)), build)
     except Exception as e:
-        print("ERROR /api/feedback/forms/<fid>:", e)
+        log.exception("/api/feedback/forms/<fid>")
         return jsonify({"error": str(e)}), 500
 
 # Rezultate agregate (pentru UI)
@@ -2621,12 +3185,13 @@ def get_feedback_form(fid):
 def feedback_results(fid):
     try:
         data = load_data()
-        form = next((f for f in data.get("feedback_forms", []) if str(f.get("id")) == str(fid)), None)
+        form = _feedback_form_by_id(data, fid)
         if not form:
                             return jsonify({"error": "Form not found"}), 404
-        return jsonify(_aggregate_feedback(form))
+        # re-aggregated only after a save (a new response, an edited form, ...)
+        return _cached_json(("feedback_results", str(fid)), lambda: _aggregate_feedback(form))
     except Exception as e:
-        print("ERROR /api/feedback/forms/<fid>/results:", e)
+        log.exception("/api/feedback/forms/<fid>/results")
         return jsonify({"error": str(e)}), 500
 
 # Submit feedback responses
@@ -2634,7 +3199,7 @@ def feedback_results(fid):
 def feedback_responses(fid):
     try:
         data = load_data()
-        form = next((f for f in data.get("feedback_forms", []) if str(f.get("id")) == str(fid)), None)
+        form = _feedback_form_by_id(data, fid)
         if not form:
             return jsonify({"error": "Form not found"}), 404
         
@@ -2656,17 +3221,11 @@ def feedback_responses(fid):
             "ts": int(time.time()),
             "answers": answers
         }
-        
-        # Persist the data
-        for i, f in enumerate(data.get("feedback_forms", [])):
-            if str(f.get("id")) == str(fid):
-                data["feedback_forms"][i] = form
-                break
-        save_data(data)
+        save_data(data, durable=True)
         
         return jsonify({"status": "ok"})
     except Exception as e:
-        print("ERROR /api/feedback/forms/<fid>/responses:", e)
+        log.exception("/api/feedback/forms/<fid>/responses")
         return jsonify({"error": str(e)}), 500
 
 # Send message to Teams via Incoming Webhook (optional, one-click)
@@ -2676,19 +3235,14 @@ def feedback_teams_send(fid):
         if not TEAMS_WEBHOOK_URL:
             return jsonify({"error": "Missing TEAMS_WEBHOOK_URL"}), 400
         data = load_data()
-        form = next((f for f in data.get("feedback_forms", []) if str(f.get("id")) == str(fid)), None)
+        form = _feedback_form_by_id(data, fid)
         if not form:
                             return jsonify({"error": "Form not found"}), 404
         msg = (request.json or {}).get("text") or f"Please complete the feedback: {url_for('feedback_fill', fid=fid, _external=True)}"
-        import json as _json
-        from urllib import request as _urlreq
-        payload = _json.dumps({"text": msg}).encode("utf-8")
-        req = _urlreq.Request(TEAMS_WEBHOOK_URL, data=payload, headers={"Content-Type": "application/json"})
-        with _urlreq.urlopen(req) as resp:
-            _ = resp.read()
+        _teams_post(orjson.dumps({"text": msg}))
         return jsonify({"status": "sent"})
     except Exception as e:
-        print("ERROR teams-send:", e)
+        log.exception("teams-send")
         return jsonify({"error": str(e)}), 500
 
 # ========== Public page: complete feedback ==========
@@ -2704,10 +3258,11 @@ def feedback_fill(fid=None):
             return make_response("Form ID required", 400)
             
         data = load_data()
-        form = next((f for f in data.get("feedback_forms", []) if str(f.get("id")) == str(fid)), None)
+        form = _feedback_form_by_id(data, fid)
         if not form:
             return make_response("Form not found", 404)
         meeting = _meeting_by_id(data, form.get("meeting_id")) or {}
+        invited_map = _participants_by_email_map(meeting)
 
         # Format dorit?
         def want_json():
@@ -2725,7 +3280,6 @@ def feedback_fill(fid=None):
 
         # POST: record response
         if request.method == "POST" and email:
-            invited_map = _participants_by_email_map(meeting)
             if email not in invited_map:
                 if want_json():
                     return jsonify({"error": "Email is not in the invite list"}), 403
@@ -2740,12 +3294,7 @@ def feedback_fill(fid=None):
                     answers[qid] = request.form.get(qid)
             # single response per email (overwrite)
             form.setdefault("responses", {})[email] = {"ts": int(time.time()), "answers": answers}
-            # persist
-            for i, f in enumerate(data.get("feedback_forms", [])):
-                if str(f.get("id")) == str(fid):
-                    data["feedback_forms"][i] = form
-                    break
-            save_data(data)
+            save_data(data, durable=True)
             if want_json():
                 return jsonify({"status": "ok"})
             return render_template("feedback_fill.html", done=True, form=form, meeting=meeting, email=email)
@@ -2759,15 +3308,14 @@ def feedback_fill(fid=None):
                 })
             return render_template("feedback_fill.html", form=form, meeting=meeting, email="")
 
-        invited_map = _participants_by_email_map(meeting)
         if email not in invited_map:
             if want_json():
                 return jsonify({"error": "Email is not in the invite list"}), 403
             return render_template("feedback_fill.html", error="You are not in the invite list.", form=form, meeting=meeting, email="")
 
         return render_template("feedback_fill.html", form=form, meeting=meeting, email=email)
-    except Exception as e:
-        print("ERROR /feedback/<fid>:", e)
+    except Exception:
+        log.exception("/feedback/<fid>")
         return make_response("Feedback error.", 500)
 
 # ---------- PPTX ----------
@@ -2778,16 +3326,20 @@ def pptx_report():
         filename = generate_pptx_report(payload)
         return jsonify({"filename": filename})
     except Exception as e:
-        print("ERROR /api/pptx-report:", e)
+        log.exception("/api/pptx-report")
         return jsonify({"error": str(e)}), 500
 
+GENERATED_DIR = "static/generated"
+os.makedirs(GENERATED_DIR, exist_ok=True)
+
 @app.route("/static/generated/<filename>")
 def serve_generated_file(filename):
     """Serve generated files (PPTX, HTML reports)"""
     try:
-        return send_from_directory("static/generated", filename)
-    except Exception as e:
-        print(f"ERROR serving generated file {filename}:", e)
+        # names carry a timestamp, so a given file never changes
+        return send_from_directory(GENERATED_DIR, filename, max_age=86400)
+    except Exception:
+        log.exception("serving generated file %s", filename)
         return jsonify({"error": "File not found"}), 404
 
 # ---------- AI Reports ----------
@@ -2811,7 +3363,7 @@ def generate_ai_report():
             "status": "success"
         })
     except Exception as e:
-        print("ERROR /api/ai/generate-report:", e)
+        log.exception("/api/ai/generate-report")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/generate-report-html", methods=["POST"])
@@ -2821,33 +3373,18 @@ def generate_report_html():
         report = payload.get("report", {})
         filename = payload.get("filename", "report")
         
-        # Avoid UnicodeEncodeError on Windows consoles by printing ASCII-safe preview
-        try:
-            print(f"Generating HTML for: {filename}")
-            print("Report data:", ascii(report))
-        except Exception:
-            try:
-                print(f"Generating HTML for: {filename}")
-                print("Report data: <unavailable for console>")
-            except Exception:
-                pass
+        # ascii() avoids UnicodeEncodeError on Windows consoles
+        log.info("Generating HTML for: %s", filename)
+        log.debug("Report data: %s", ascii(report))
         
         # Generate HTML report
         html_content = generate_html_report(report)
         
-        # Save HTML file
-        import os
-        import time
-        
-        generated_dir = "static/generated"
-        os.makedirs(generated_dir, exist_ok=True)
-        
+        # Save HTML file (atomically: a download never sees half a report)
         timestamp = int(time.time())
         html_filename = f"{filename}_{timestamp}.html"
-        html_path = os.path.join(generated_dir, html_filename)
-        
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        html_path = os.path.join(GENERATED_DIR, html_filename)
+        _atomic_write(html_path, html_content.encode("utf-8"))
         
         # Return download URL
         download_url = f"/static/generated/{html_filename}"
@@ -2857,30 +3394,29 @@ def generate_report_html():
             "status": "success"
         })
     except Exception as e:
-        print("ERROR /api/generate-report-html:", e)
+        log.exception("/api/generate-report-html")
         return jsonify({"error": str(e)}), 500
 
-def generate_html_report(report):
-    period = report.get('period', 'Unknown Period')
-    content = report.get('content', 'No content available')
-    data = report.get('data', {})
-    report_type = report.get('type', 'quarter')
-    settings = report.get('settings', {})
-    
-    # Clean up content for HTML
-    html_content = content.replace('**', '<strong>').replace('**', '</strong>')
-    html_content = html_content.replace('\n- ', '\n<li>').replace('\n', '<br>')
-    html_content = html_content.replace('<li>', '<ul><li>').replace('</li><br>', '</li></ul><br>')
-    
-    html_template = f"""
+_REPORT_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_REPORT_LIST_RE = re.compile(r"(?:^- .*(?:\n|$))+", re.MULTILINE)  # a run of "- item" lines
+
+def _report_markup(content):
+    """Report text (light markdown: **bold**, "- " lists) as HTML; everything else is escaped."""
+    html = str(escape(content))
+    html = _REPORT_BOLD_RE.sub(r"<strong>\1</strong>", html)
+    html = _REPORT_LIST_RE.sub(
+        lambda m: "<ul>" + "".join(f"<li>{line[2:]}</li>" for line in m.group(0).splitlines()) + "</ul>", html)
+    return Markup(html.replace("\n", "<br>"))
+
+_REPORT_TMPL = app.jinja_env.from_string("""
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>QA Leadership Report - {period}</title>
+        <title>QA Leadership Report - {{ period }}</title>
         <style>
-            body {{
+            body {
                 font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
                 line-height: 1.6;
                 color: #333;
@@ -2888,8 +3424,8 @@ def generate_html_report(report):
                 margin: 0 auto;
                 padding: 20px;
                 background: #f8fafc;
-            }}
-            .header {{
+            }
+            .header {
                 background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
                 color: white;
                 padding: 40px;
@@ -2897,116 +3433,128 @@ def generate_html_report(report):
                 text-align: center;
                 margin-bottom: 30px;
                 box-shadow: 0 8px 25px rgba(102, 126, 234, 0.3);
-            }}
-            .header h1 {{
+            }
+            .header h1 {
                 margin: 0 0 10px 0;
                 font-size: 2.5em;
                 font-weight: 700;
-            }}
-            .header p {{
+            }
+            .header p {
                 margin: 0;
                 font-size: 1.2em;
                 opacity: 0.9;
-            }}
-            .content {{
+            }
+            .content {
                 background: white;
                 padding: 40px;
                 border-radius: 12px;
                 box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
                 margin-bottom: 30px;
-            }}
-            .section {{
+            }
+            .section {
                 margin-bottom: 30px;
                 padding: 20px;
                 border-left: 4px solid #3b82f6;
                 background: #f8fafc;
                 border-radius: 8px;
-            }}
-            .section h2 {{
+            }
+            .section h2 {
                 color: #1e40af;
                 margin-top: 0;
                 font-size: 1.5em;
                 border-bottom: 2px solid #e5e7eb;
                 padding-bottom: 10px;
-            }}
-            .stats {{
+            }
+            .stats {
                 display: grid;
                 grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
                 gap: 20px;
                 margin: 20px 0;
-            }}
-            .stat-card {{
+            }
+            .stat-card {
                 background: white;
                 padding: 20px;
                 border-radius: 8px;
                 text-align: center;
                 box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
                 border: 1px solid #e5e7eb;
-            }}
-            .stat-number {{
+            }
+            .stat-number {
                 font-size: 2em;
                 font-weight: 700;
                 color: #3b82f6;
                 margin-bottom: 5px;
-            }}
-            .stat-label {{
+            }
+            .stat-label {
                 color: #6b7280;
                 font-size: 0.9em;
                 text-transform: uppercase;
                 letter-spacing: 0.5px;
-            }}
-            ul {{
+            }
+            ul {
                 padding-left: 20px;
-            }}
-            li {{
+            }
+            li {
                 margin-bottom: 8px;
-            }}
-            .footer {{
+            }
+            .footer {
                 text-align: center;
                 color: #6b7280;
                 font-size: 0.9em;
                 margin-top: 40px;
                 padding: 20px;
                 border-top: 1px solid #e5e7eb;
-            }}
+            }
         </style>
     </head>
     <body>
         <div class="header">
             <h1>QA Leadership Report</h1>
-            <p>{period} - {report_type.title()} Analysis</p>
+            <p>{{ period }} - {{ report_type|title }} Analysis</p>
         </div>
         
         <div class="content">
             <div class="stats">
                 <div class="stat-card">
-                    <div class="stat-number">{data.get('totalMeetings', 0)}</div>
+                    <div class="stat-number">{{ data.get('totalMeetings', 0) }}</div>
                     <div class="stat-label">Total Meetings</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-number">{data.get('averageAttendance', 0):.1f}%</div>
+                    <div class="stat-number">{{ "%.1f"|format(data.get('averageAttendance', 0)) }}%</div>
                     <div class="stat-label">Avg Attendance</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-number">{data.get('averageRating', 0):.1f}/5</div>
+                    <div class="stat-number">{{ "%.1f"|format(data.get('averageRating', 0)) }}/5</div>
                     <div class="stat-label">Avg Rating</div>
                 </div>
             </div>
             
             <div class="section">
                 <h2>Report Content</h2>
-                <div>{html_content}</div>
+                <div>{{ html_content }}</div>
             </div>
         </div>
         
         <div class="footer">
-            <p>Generated on {time.strftime('%Y-%m-%d %H:%M:%S')} | QA Leadership Tool</p>
+            <p>Generated on {{ generated_at }} | QA Leadership Tool</p>
         </div>
     </body>
     </html>
-    """
+    """)
+
+def generate_html_report(report):
+    period = report.get('period', 'Unknown Period')
+    content = report.get('content', 'No content available')
+    data = report.get('data', {})
+    report_type = report.get('type', 'quarter')
     
-    return html_template
+    return _REPORT_TMPL.render(
+        period=period,
+        report_type=report_type,
+        data=data,
+        html_content=_report_markup(content),
+        generated_at=time.strftime('%Y-%m-%d %H:%M:%S'),
+    )
 
 @app.route("/api/rewards/badges", methods=["GET", "POST"])
 def rewards_badges():
@@ -3023,7 +3571,7 @@ def rewards_badges():
                 return jsonify({"error": "icon and name required"}), 400
             
             badge = {
-                "id": int(time.time() * 1000),
+                "id": _new_id(),
                 "icon": icon,
                 "name": name,
                 "points": points,
@@ -3041,7 +3589,7 @@ def rewards_badges():
         # GET - return all custom badges
         return jsonify(data.get("custom_badges", []))
     except Exception as e:
-        print("ERROR /api/rewards/badges:", e)
+        log.exception("/api/rewards/badges")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/rewards/badges/<int:badge_id>", methods=["DELETE"])
@@ -3060,7 +3608,7 @@ def delete_custom_badge(badge_id):
         
         return jsonify({"error": "Badge not found"}), 404
     except Exception as e:
-        print("ERROR DELETE /api/rewards/badges/<id>:", e)
+        log.exception("DELETE /api/rewards/badges/<id>")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/quizz")
@@ -3075,7 +3623,7 @@ def quiz_sessions():
         data.setdefault("quiz_sessions", [])
         if request.method == "POST":
             p = request.json or {}
-            sid = int(time.time() * 1000)
+            sid = _new_id()
             session = {
                 "id": sid,
                 "quiz_id": p.get("quiz_id"),
@@ -3096,20 +3644,14 @@ def quiz_sessions():
             sid = p.get("id")
             if not sid:
                 return jsonify({"error": "Missing id"}), 400
-            sessions = data.get("quiz_sessions", [])
-            found = None
-            for i, s in enumerate(sessions):
-                if str(s.get("id")) == str(sid):
-                    found = i
-                    break
-            if found is None:
+            s = _index(data, "quiz_sessions_by_id").get(str(sid))
+            if s is None:
                 return jsonify({"error": "Not found"}), 404
             # allowed updates
             for k, v in p.items():
                 if k == "id":
                     continue
-                sessions[found][k] = v
-            data["quiz_sessions"] = sessions
+                s[k] = v
             save_data(data)
             return jsonify({"status": "updated"}), 200
         if request.method == "DELETE":
@@ -3120,9 +3662,9 @@ def quiz_sessions():
             save_data(data)
             return jsonify({"status": "deleted"}), 200
         # GET
-        return jsonify(data.get("quiz_sessions", []))
+        return _cached_json(("quiz_sessions",), lambda: data.get("quiz_sessions", []))
     except Exception as e:
-        print("ERROR /api/quiz-sessions:", e)
+        log.exception("/api/quiz-sessions")
         return jsonify({"error": str(e)}), 500
 
 # Generate QR for player join
@@ -3130,22 +3672,16 @@ def quiz_sessions():
 def quiz_session_qr(sid):
     try:
         data = load_data()
-        sessions = data.get("quiz_sessions", [])
-        sess = next((s for s in sessions if str(s.get("id")) == str(sid)), None)
+        sess = _index(data, "quiz_sessions_by_id").get(str(sid))
         if not sess:
             return jsonify({"error": "Session not found"}), 404
         join_url = url_for("quiz_join", sid=sid, _external=True)
         qr_url, ts = _versioned_qr_png(join_url, f"qr_quiz_{sid}")
         sess["join_qr"] = {"url": join_url, "qr_url": qr_url, "ts": ts}
-        for i, s in enumerate(sessions):
-            if str(s.get("id")) == str(sid):
-                sessions[i] = sess
-                break
-        data["quiz_sessions"] = sessions
         save_data(data)
         return jsonify({"qr_url": qr_url, "join_url": join_url, "ts": ts})
     except Exception as e:
-        print("ERROR /api/quiz-sessions/<sid>/qr:", e)
+        log.exception("/api/quiz-sessions/<sid>/qr")
         return jsonify({"error": str(e)}), 500
 
 # Player join page
@@ -3153,30 +3689,24 @@ def quiz_session_qr(sid):
 def quiz_join(sid):
     try:
         data = load_data()
-        sessions = data.get("quiz_sessions", [])
-        sess = next((s for s in sessions if str(s.get("id")) == str(sid)), None)
+        sess = _index(data, "quiz_sessions_by_id").get(str(sid))
         if not sess:
             return make_response("Session not found", 404)
         if request.method == "POST":
             nickname = (request.form.get("nickname") or "").strip()
             if not nickname:
                 return make_response("Nickname required", 400)
-            pid = str(int(time.time() * 1000))
+            pid = str(_new_id())
             players = sess.get("players") or {}
             players[pid] = {"nickname": nickname, "score": 0}
             sess["players"] = players
-            for i, s in enumerate(sessions):
-                if str(s.get("id")) == str(sid):
-                    sessions[i] = sess
-                    break
-            data["quiz_sessions"] = sessions
             save_data(data)
             # redirect into play page with pid stored via URL param
             return redirect(url_for("quiz_play", sid=sid, pid=pid))
         # render join page
         return render_template("quiz_join.html", sid=str(sid))
-    except Exception as e:
-        print("ERROR /quiz/<sid>/join:", e)
+    except Exception:
+        log.exception("/quiz/<sid>/join")
         return make_response("Error", 500)
 
 # Player play page
@@ -3184,8 +3714,8 @@ def quiz_join(sid):
 def quiz_play(sid):
     try:
         return render_template("quiz_play.html", sid=str(sid), pid=request.args.get("pid", ""))
-    except Exception as e:
-        print("ERROR /quiz/<sid>/play:", e)
+    except Exception:
+        log.exception("/quiz/<sid>/play")
         return make_response("Error", 500)
 
 # Admin controls: start/next/reveal/end
@@ -3193,13 +3723,12 @@ def quiz_play(sid):
 def quiz_control(sid):
     try:
         data = load_data()
-        sessions = data.get("quiz_sessions", [])
-        sess = next((s for s in sessions if str(s.get("id")) == str(sid)), None)
+        sess = _index(data, "quiz_sessions_by_id").get(str(sid))
         if not sess:
             return jsonify({"error": "Session not found"}), 404
         payload = request.json or {}
         action = (payload.get("action") or "").lower()
-        quiz = next((q for q in data.get("quizzes", []) if str(q.get("id")) == str(sess.get("quiz_id"))), None)
+        quiz = _index(data, "quizzes_by_id").get(str(sess.get("quiz_id")))
         total_q = len((quiz or {}).get("questions", []))
         now_ms = int(time.time() * 1000)
         if action == "start":
@@ -3235,25 +3764,20 @@ def quiz_control(sid):
             sess["status"] = "finished"
         else:
             return jsonify({"error": "Unknown action"}), 400
-        for i, s in enumerate(sessions):
-            if str(s.get("id")) == str(sid):
-                sessions[i] = sess
-                break
-        data["quiz_sessions"] = sessions
         save_data(data)
         return jsonify({"status": "ok"})
     except Exception as e:
-        print("ERROR /api/quiz-sessions/<sid>/control:", e)
+        log.exception("/api/quiz-sessions/<sid>/control")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/quiz-sessions/<sid>/state", methods=["GET"])
 def quiz_state(sid):
     try:
         data = load_data()
-        sess = next((s for s in data.get("quiz_sessions", []) if str(s.get("id")) == str(sid)), None)
+        sess = _index(data, "quiz_sessions_by_id").get(str(sid))
         if not sess:
             return jsonify({"error": "Session not found"}), 404
-        quiz = next((q for q in data.get("quizzes", []) if str(q.get("id")) == str(sess.get("quiz_id"))), None)
+        quiz = _index(data, "quizzes_by_id").get(str(sess.get("quiz_id")))
         current_index = int(sess.get("current_index", -1))
         reveal = bool(sess.get("reveal", False))
         questions = quiz.get("questions", []) if quiz else []
@@ -3285,22 +3809,21 @@ def quiz_state(sid):
             payload["question"] = q
         return jsonify(payload)
     except Exception as e:
-        print("ERROR /api/quiz-sessions/<sid>/state:", e)
+        log.exception("/api/quiz-sessions/<sid>/state")
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/quiz-sessions/<sid>/submit", methods=["POST"])
 def quiz_submit(sid):
     try:
         data = load_data()
-        sessions = data.get("quiz_sessions", [])
-        sess = next((s for s in sessions if str(s.get("id")) == str(sid)), None)
+        sess = _index(data, "quiz_sessions_by_id").get(str(sid))
         if not sess:
             return jsonify({"error": "Session not found"}), 404
         p = request.json or {}
         pid = str(p.get("pid") or "")
         if pid not in (sess.get("players") or {}):
             return jsonify({"error": "Player not in session"}), 403
-        quiz = next((q for q in data.get("quizzes", []) if str(q.get("id")) == str(sess.get("quiz_id"))), None)
+        quiz = _index(data, "quizzes_by_id").get(str(sess.get("quiz_id")))
         ci = int(sess.get("current_index", -1))
         if ci < 0:
             return jsonify({"error": "No active question"}), 400
@@ -3341,15 +3864,10 @@ def quiz_submit(sid):
         player["score"] = round(float(player.get("score", 0)) + submitted["points"], 3)
         sess["players"][pid] = player
         # persist
-        for i, s in enumerate(sessions):
-            if str(s.get("id")) == str(sid):
-                sessions[i] = sess
-                break
-        data["quiz_sessions"] = sessions
         save_data(data)
         return jsonify({"status": "recorded", "points": submitted["points"], "time_ratio": round(time_ratio,3), "correctness_ratio": round(correctness_ratio,3)})
     except Exception as e:
-        print("ERROR /api/quiz-sessions/<sid>/submit:", e)
+        log.exception("/api/quiz-sessions/<sid>/submit")
         return jsonify({"error": str(e)}), 500
 
 def _grade_quiz_ratio(question: dict, answer_payload) -> float:
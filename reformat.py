@@ -0,0 +1,12 @@
+"""
+data.json is stored compact (orjson, no indentation).
+Print a pretty, human-readable copy: python reformat.py [data.json] > data.pretty.json
+"""
+import sys
+
+import orjson
+
+path = sys.argv[1] if len(sys.argv) > 1 else "data.json"
+with open(path, "rb") as f:
+    data = orjson.loads(f.read())
+sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) + b"\n")
@@ -1,6 +1,7 @@
+import functools
 import os
-import json
 import re
+import orjson
 from typing import List, Dict, Any, Tuple
 
 from openai import OpenAI
@@ -9,27 +10,61 @@ LM_BASE_URL = os.getenv("LM_BASE_URL", "http://127.0.0.1:80/v1")
 LM_MODEL_ID = os.getenv("LM_MODEL_ID", "meta-llama-3.1-8b-instruct-128k")
 LM_API_KEY   = os.getenv("OPENAI_API_KEY", "lm-studio")
 
-client = OpenAI(base_url=LM_BASE_URL, api_key=LM_API_KEY)
+@functools.cache
+def get_client() -> OpenAI:
+    """The one OpenAI client (and HTTP connection pool) shared by every LLM call in the app."""
+    return OpenAI(base_url=LM_BASE_URL, api_key=LM_API_KEY)
 
 # ---------- helpers ----------
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.IGNORECASE | re.DOTALL)
+
+def _first_json_object(text: str, start: int) -> str:
+    """The balanced {...} starting at text[start], skipping braces inside string literals."""
+    depth = 0
+    in_str = escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_str:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return ""
+
 def _extract_json_block(text: str) -> str:
     if not text:
         raise ValueError("Empty text")
-    m = re.search(r"```json\s*({[\s\S]*?})\s*```", text, re.IGNORECASE)
-    if m: return m.group(1).strip()
-    m = re.search(r"```\s*({[\s\S]*?})\s*```", text, re.IGNORECASE)
+    stripped = text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        return stripped  # model followed the "JSON only" instruction
+    m = _JSON_FENCE.search(text)
     if m: return m.group(1).strip()
-    s = text.find("{"); e = text.rfind("}")
-    if s != -1 and e != -1 and e > s:
-        return text[s:e+1].strip()
+    s = text.find("{")
+    if s != -1:
+        block = _first_json_object(text, s)
+        if block:
+            return block
+        e = text.rfind("}")
+        if e > s:
+            return text[s:e+1].strip()
     raise ValueError("No JSON object found")
 
 def _json_loads_safe(s: str) -> Dict[str, Any]:
     try:
-        return json.loads(s)
-    except json.JSONDecodeError:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError:
         s2 = s.replace("“", '"').replace("”", '"').replace("’", "'")
-        return json.loads(s2)
+        return orjson.loads(s2)
 
 def _normalize(s: str) -> str:
     return (s or "").strip().lower()
@@ -114,7 +149,7 @@ INSTRUCTIONS:
 """
 
     try:
-        resp = client.chat.completions.create(
+        resp = get_client().chat.completions.create(
             model=LM_MODEL_ID,
             messages=[{"role":"system","content":system_rules},{"role":"user","content":prompt}],
             temperature=0.2,
@@ -198,7 +233,7 @@ REQUIREMENTS:
 """
 
     try:
-        resp = client.chat.completions.create(
+        resp = get_client().chat.completions.create(
             model=LM_MODEL_ID,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
@@ -266,7 +301,7 @@ Output ONLY JSON, nothing else.
 """
 
     try:
-        resp = client.chat.completions.create(
+        resp = get_client().chat.completions.create(
             model=LM_MODEL_ID,
             messages=[{"role":"system","content":system},{"role":"user","content":prompt}],
             temperature=0.3,
@@ -297,7 +332,7 @@ def generate_ai_report_content(prompt: str, data: Dict[str, Any]) -> str:
     Generate AI report content using LLM based on meeting data
     """
     try:
-        response = client.chat.completions.create(
+        response = get_client().chat.completions.create(
             model=LM_MODEL_ID,
             messages=[
                 {